@@ -5,14 +5,24 @@ Run with: streamlit run app.py
 
 import streamlit as st
 import asyncio
-from datetime import datetime
+import itertools
+import operator
+import re
 import os
+import threading
 from dotenv import load_dotenv
 
-from src.chatbot import CalChatbot
-
 load_dotenv()
 
+# Queries that need an email configured before we can answer them
+_EMAIL_GATE = re.compile(r"show|list|my meetings|my events", re.IGNORECASE)
+
+_DEFAULT_EMAIL = os.getenv("CAL_USER_EMAIL", "")
+
+# Number of recent messages sent to the LLM verbatim; older turns are
+# folded into a cached summary so prompt size stays flat over long chats
+_HISTORY_WINDOW = 12
+
 # Page config
 st.set_page_config(
     page_title="Cal.com Meeting Assistant",
@@ -20,8 +30,10 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Static markup built once at import so reruns don't rebuild the strings.
+# The st.markdown calls themselves must still run every rerun — Streamlit
+# rebuilds the element tree each time, so cached emission would drop the CSS.
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -52,38 +64,153 @@ st.markdown("""
         margin-bottom: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER = '<div class="main-header">📅 Cal.com Meeting Assistant</div>'
+_SUB_HEADER = '<div class="sub-header">Book, view, and manage your meetings with natural language</div>'
+_FOOTER = (
+    '<div style="text-align: center; color: #666; font-size: 0.9rem;">'
+    'Powered by OpenAI GPT-4 and Cal.com API'
+    '</div>'
+)
+
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Initialize session state
-if "messages" not in st.session_state:
-    st.session_state.messages = []
+ss = st.session_state
+# Chat history as parallel role/content arrays; dicts are only materialized
+# at the chatbot API boundary
+ss.setdefault("roles", [])
+ss.setdefault("contents", [])
+ss.setdefault("user_email", _DEFAULT_EMAIL)
+
+
+@st.cache_resource
+def get_loop() -> asyncio.AbstractEventLoop:
+    """One background event loop shared by every session
+
+    The chatbot is process-wide (see get_chatbot), and its semaphores and
+    httpx/OpenAI connection pools bind to whichever loop first awaits
+    them — so all sessions must await on the same loop, or the second
+    concurrent tab hits "bound to a different event loop" errors. The
+    loop runs on a daemon thread and stays alive across reruns, which
+    also keeps the HTTP pools warm between turns.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="chatbot-loop", daemon=True).start()
+    return loop
+
+
+def _run(coro):
+    """Run a coroutine on the shared loop and block for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+@st.cache_resource
+def get_chatbot():
+    """Create one chatbot instance shared across all sessions
+
+    The import is deferred so the heavy chatbot stack (openai, httpx) isn't
+    loaded before Streamlit draws the first frame; cache_resource means it
+    only ever runs once per process.
+    """
+    from src.chatbot import CalChatbot
+
+    return CalChatbot()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_bookings(user_email: str):
+    """Fetch upcoming bookings for the sidebar, cached for a minute
+
+    Turns bursts of sidebar reruns into a single Cal.com call; the refresh
+    button clears the cache after the user books or cancels something.
+    """
+    return _run(get_chatbot().cal_client.get_bookings(attendee_email=user_email))
+
+
+def _summarize(messages) -> str:
+    """Summarize older conversation turns into a short paragraph
+
+    Runs on the chatbot's responder (formatting) model, same as
+    CalChatbot._compact_history: summarization doesn't need the planning
+    model, and reusing the configured knob keeps model choice in one place.
+    """
+    chatbot = get_chatbot()
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+    response = _run(
+        chatbot.openai_client.chat.completions.create(
+            model=chatbot.responder_model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Summarize the following conversation in under 150 words. "
+                               "Keep names, emails, dates, times, and booking details."
+                },
+                {"role": "user", "content": transcript}
+            ]
+        )
+    )
+    return response.choices[0].message.content
+
 
-if "chatbot" not in st.session_state:
-    st.session_state.chatbot = None
+def _trimmed_history():
+    """History for the LLM: a summary of old turns plus the recent window
 
-if "user_email" not in st.session_state:
-    st.session_state.user_email = os.getenv("CAL_USER_EMAIL", "")
+    The summary is cached in session_state keyed by the prefix length, so
+    it is only recomputed when more turns fall out of the window.
+    """
+    ss = st.session_state
+    messages = [
+        {"role": role, "content": content}
+        for role, content in zip(ss.roles[:-1], ss.contents[:-1])
+    ]
+    if len(messages) <= _HISTORY_WINDOW:
+        return messages
 
+    cutoff = len(messages) - _HISTORY_WINDOW
+    cached = st.session_state.get("history_summary")
+    if not cached or cached[0] != cutoff:
+        cached = (cutoff, _summarize(messages[:cutoff]))
+        st.session_state.history_summary = cached
 
-async def init_chatbot():
-    """Initialize the chatbot"""
-    if st.session_state.chatbot is None:
-        st.session_state.chatbot = CalChatbot()
+    summary_msg = {"role": "system", "content": f"Summary of earlier conversation: {cached[1]}"}
+    return [summary_msg] + messages[cutoff:]
 
 
-async def send_message(user_message: str, user_email: str):
-    """Send a message to the chatbot"""
-    response, updated_history = await st.session_state.chatbot.chat(
+def stream_response(user_message: str, user_email: str):
+    """Yield response chunks from the chatbot for st.write_stream
+
+    Consumes the framed event stream rather than bare tokens so a turn
+    that books, cancels, or reschedules can clear the sidebar's bookings
+    cache the moment its tool call completes — otherwise the "Upcoming
+    meetings" list stays stale for the remainder of its one-minute TTL.
+    """
+    from src.chatbot import _MUTATING_FUNCTIONS
+
+    agen = get_chatbot().chat_events(
         user_message=user_message,
-        conversation_history=st.session_state.messages,
+        conversation_history=_trimmed_history(),
         user_email=user_email
     )
-    return response, updated_history
 
+    while True:
+        try:
+            event = _run(agen.__anext__())
+        except StopAsyncIteration:
+            break
+        if event["type"] == "token":
+            yield event["delta"]
+        elif event["type"] == "tool_result" and event["name"] in _MUTATING_FUNCTIONS:
+            _cached_bookings.clear()
+
+
+# Initialize chatbot (shared process-wide across all sessions)
+chatbot_ready = get_chatbot() is not None
 
 # Main UI
-st.markdown('<div class="main-header">📅 Cal.com Meeting Assistant</div>', unsafe_allow_html=True)
-st.markdown('<div class="sub-header">Book, view, and manage your meetings with natural language</div>', unsafe_allow_html=True)
+st.markdown(_HEADER, unsafe_allow_html=True)
+st.markdown(_SUB_HEADER, unsafe_allow_html=True)
 
 # Sidebar
 with st.sidebar:
@@ -118,71 +245,78 @@ with st.sidebar:
 
     st.markdown("---")
 
+    if user_email:
+        with st.expander("📋 Upcoming meetings"):
+            if st.button("🔄 Refresh", use_container_width=True):
+                _cached_bookings.clear()
+            try:
+                bookings = _cached_bookings(user_email)
+                if bookings:
+                    for booking in bookings[:5]:
+                        st.markdown(f"- **{booking.get('title', 'Meeting')}** — {booking.get('startTime', '')}")
+                else:
+                    st.caption("No upcoming meetings")
+            except Exception as e:
+                st.caption(f"Could not load meetings: {e}")
+
+        st.markdown("---")
+
     if st.button("🗑️ Clear Chat", use_container_width=True):
-        st.session_state.messages = []
+        st.session_state.roles = []
+        st.session_state.contents = []
+        st.session_state.pop("history_summary", None)
         st.rerun()
 
     # Status indicator
-    if st.session_state.chatbot:
+    if chatbot_ready:
         st.success("✅ Chatbot Ready")
     else:
         st.info("🔄 Initializing...")
 
-# Initialize chatbot
-asyncio.run(init_chatbot())
-
 # Chat interface
-chat_container = st.container()
-
-with chat_container:
-    # Display chat history
-    for msg in st.session_state.messages:
-        role = msg["role"]
-        content = msg["content"]
-
-        if role == "user":
+@st.fragment
+def chat_panel():
+    """Chat log and input, scoped so each message reruns only this fragment"""
+    # Display chat history; consecutive same-role messages are joined into a
+    # single markdown block so each run costs one frontend container
+    history = zip(st.session_state.roles, st.session_state.contents)
+    for role, run in itertools.groupby(history, key=operator.itemgetter(0)):
+        if role in ("user", "assistant"):
+            st.chat_message(role).markdown(
+                "\n\n---\n\n".join(content for _, content in run)
+            )
+
+    # Chat input; strip whitespace so blank submissions don't burn an LLM call
+    if (prompt := st.chat_input("Type your message here...")) and (prompt := prompt.strip()):
+        # Check if email is provided for certain queries
+        if not st.session_state.user_email and _EMAIL_GATE.search(prompt):
+            st.error("⚠️ Please provide your email in the sidebar to view your meetings")
+        else:
+            # Add user message to chat
+            st.session_state.roles.append("user")
+            st.session_state.contents.append(prompt)
+
+            # Display user message
             with st.chat_message("user"):
-                st.markdown(content)
-        elif role == "assistant":
-            with st.chat_message("assistant"):
-                st.markdown(content)
-
-# Chat input
-if prompt := st.chat_input("Type your message here..."):
-    # Check if email is provided for certain queries
-    if not st.session_state.user_email and any(keyword in prompt.lower() for keyword in ["show", "list", "my meetings", "my events"]):
-        st.error("⚠️ Please provide your email in the sidebar to view your meetings")
-    else:
-        # Add user message to chat
-        st.session_state.messages.append({"role": "user", "content": prompt})
-
-        # Display user message
-        with st.chat_message("user"):
-            st.markdown(prompt)
+                st.markdown(prompt)
 
-        # Get bot response
-        with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
+            # Stream bot response token-by-token
+            with st.chat_message("assistant"):
                 try:
-                    response, updated_history = asyncio.run(
-                        send_message(prompt, st.session_state.user_email)
+                    response = st.write_stream(
+                        stream_response(prompt, st.session_state.user_email)
                     )
-
-                    # Update messages
-                    st.session_state.messages = updated_history
-
-                    # Display response
-                    st.markdown(response)
+                    st.session_state.roles.append("assistant")
+                    st.session_state.contents.append(response)
                 except Exception as e:
                     error_msg = f"Sorry, I encountered an error: {str(e)}"
                     st.error(error_msg)
-                    st.session_state.messages.append({"role": "assistant", "content": error_msg})
+                    st.session_state.roles.append("assistant")
+                    st.session_state.contents.append(error_msg)
+
+
+chat_panel()
 
 # Footer
 st.markdown("---")
-st.markdown(
-    '<div style="text-align: center; color: #666; font-size: 0.9rem;">'
-    'Powered by OpenAI GPT-4 and Cal.com API'
-    '</div>',
-    unsafe_allow_html=True
-)
+st.markdown(_FOOTER, unsafe_allow_html=True)
@@ -4,33 +4,70 @@ Simple CLI client for testing the chatbot REST API
 Usage: python cli_client.py
 """
 
-import requests
+import asyncio
+import httpx
 import json
 import sys
+import uuid
+
+from prompt_toolkit import PromptSession
 
 API_URL = "http://localhost:8000"
 
+# One client for the whole CLI run so the TCP connection to the server is
+# reused across turns instead of being re-established per request.
+# Streaming replies can take a while, so don't bound the read timeout.
+_CLIENT = httpx.AsyncClient(timeout=httpx.Timeout(10.0, read=None))
+
+
+async def chat(message, conversation_id, user_email):
+    """Stream a chat reply from the API, printing tokens as they arrive
 
-def chat(message, conversation_history, user_email):
-    """Send a chat message to the API"""
-    response = requests.post(
-        f"{API_URL}/chat",
+    History is kept server-side under conversation_id, so each turn only
+    sends the new message instead of the whole transcript.
+    """
+    parts = []
+
+    async with _CLIENT.stream(
+        "POST",
+        f"{API_URL}/chat/stream",
         json={
             "message": message,
-            "conversation_history": conversation_history,
+            "conversation_id": conversation_id,
             "user_email": user_email
         }
-    )
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            print(f"Error: {response.status_code}")
+            print(response.text)
+            return None
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
 
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"Error: {response.status_code}")
-        print(response.text)
-        return None
+            event = json.loads(line[6:])
+            if "delta" in event:
+                print(event["delta"], end="", flush=True)
+                parts.append(event["delta"])
+            elif "error" in event:
+                print(f"\nError: {event['error']}")
+                return None
 
+    return "".join(parts)
 
-def main():
+
+async def check_server():
+    """Health-check the API server; returns True when it is reachable"""
+    try:
+        response = await _CLIENT.get(f"{API_URL}/health")
+        return response.status_code == 200
+    except httpx.ConnectError:
+        return False
+
+
+async def main():
     """Main CLI loop"""
     print("=" * 60)
     print("Cal.com Chatbot - CLI Client")
@@ -41,15 +78,17 @@ def main():
     print("=" * 60)
     print()
 
-    # Check if server is running
-    try:
-        response = requests.get(f"{API_URL}/health")
-        if response.status_code != 200:
-            print(f"⚠️  Server health check failed: {response.status_code}")
-            print("Make sure the FastAPI server is running:")
-            print("  python src/main.py")
-            sys.exit(1)
-    except requests.exceptions.ConnectionError:
+    # Kick off the health check in the background so it overlaps with the
+    # user typing their email below
+    health_task = asyncio.create_task(check_server())
+
+    prompt = PromptSession()
+
+    # Get user email
+    user_email = (await prompt.prompt_async("Enter your email (for booking queries): ")).strip()
+    print()
+
+    if not await health_task:
         print("❌ Cannot connect to server!")
         print("Make sure the FastAPI server is running:")
         print("  python src/main.py")
@@ -58,14 +97,10 @@ def main():
     print("✅ Connected to server")
     print()
 
-    # Get user email
-    user_email = input("Enter your email (for booking queries): ").strip()
-    print()
-
-    conversation_history = []
+    conversation_id = uuid.uuid4().hex
 
     while True:
-        user_message = input("You: ").strip()
+        user_message = (await prompt.prompt_async("You: ")).strip()
 
         if user_message.lower() in ["quit", "exit", "q"]:
             print("Goodbye!")
@@ -74,17 +109,14 @@ def main():
         if not user_message:
             continue
 
-        # Send message to API
-        result = chat(user_message, conversation_history, user_email)
-
-        if result:
-            bot_response = result["response"]
-            conversation_history = result["conversation_history"]
+        # Stream the reply from the API
+        print("\nBot: ", end="", flush=True)
+        bot_response = await chat(user_message, conversation_id, user_email)
+        print("\n")
 
-            print(f"\nBot: {bot_response}\n")
-        else:
+        if not bot_response:
             print("Failed to get response from server\n")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -3,6 +3,15 @@ Example usage script demonstrating how to interact with the chatbot via code
 """
 
 import asyncio
+
+# uvloop drops per-await overhead substantially for I/O-heavy async code;
+# fall back silently to the default loop where it isn't installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from src.chatbot import CalChatbot
 
 
@@ -67,10 +76,14 @@ async def interactive_mode():
     print("Type 'quit' or 'exit' to end the conversation")
     print()
 
-    user_email = input("Enter your email: ").strip()
+    user_email = (await asyncio.to_thread(input, "Enter your email: ")).strip()
+
+    # Warm the Cal.com caches while the user types their first message;
+    # input() runs in a thread so this task can actually make progress
+    warmup = asyncio.create_task(chatbot.warm_cache(user_email))
 
     while True:
-        user_message = input("\nYou: ").strip()
+        user_message = (await asyncio.to_thread(input, "\nYou: ")).strip()
 
         if user_message.lower() in ["quit", "exit"]:
             print("Goodbye!")
@@ -80,13 +93,25 @@ async def interactive_mode():
             continue
 
         try:
-            response, conversation_history = await chatbot.chat(
+            # Stream tokens as they arrive instead of waiting for the full
+            # reply; chat_stream leaves history updates to the caller
+            print("\nBot: ", end="", flush=True)
+            parts = []
+            async for delta in chatbot.chat_stream(
                 user_message=user_message,
                 conversation_history=conversation_history,
                 user_email=user_email
-            )
+            ):
+                print(delta, end="", flush=True)
+                parts.append(delta)
+            print()
+
+            conversation_history.append({"role": "user", "content": user_message})
+            conversation_history.append({"role": "assistant", "content": "".join(parts)})
 
-            print(f"\nBot: {response}")
+            # Cap the history so long REPL sessions keep a flat token count
+            if len(conversation_history) > 40:
+                del conversation_history[:-40]
         except Exception as e:
             print(f"\nError: {str(e)}")
 
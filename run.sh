@@ -59,7 +59,9 @@ case $choice in
         echo ""
         echo "🧪 Testing Cal.com API..."
         echo ""
-        python test_api.py
+        # Short-lived diagnostic; skip writing .pyc files to avoid disk
+        # churn (frozen stdlib modules are already on by default on 3.11+)
+        PYTHONDONTWRITEBYTECODE=1 python test_api.py
         ;;
     2)
         echo ""
@@ -1 +1,5 @@
 # Cal.com Chatbot Package
+#
+# Deliberately import-free: `from src.models import ...` must not
+# transitively pull in httpx/openai, so cold starts and test imports stay
+# cheap. Heavy dependencies load only when their module is imported.
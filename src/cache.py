@@ -0,0 +1,64 @@
+"""
+Tiny TTL cache used by the Cal.com client
+
+A minimal stand-in for cachetools.TTLCache: bounded size, per-entry expiry,
+no external dependency. Not thread-safe — intended for use from a single
+event loop, which is how the rest of this package runs.
+"""
+
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, value); dict order doubles as last-set order,
+        # so capacity eviction drops the least recently touched entry
+        self._data: dict = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() >= entry[0]:
+            del self._data[key]
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value; ttl overrides the cache default for this entry"""
+        if key in self._data:
+            # Delete and reinsert so the key moves to the back of the dict
+            # order; updating in place would leave it looking old to _evict
+            del self._data[key]
+        elif len(self._data) >= self.maxsize:
+            self._evict()
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        if entry is None or time.monotonic() >= entry[0]:
+            return default
+        return entry[1]
+
+    def clear(self):
+        self._data.clear()
+
+    def keys(self):
+        return list(self._data.keys())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self):
+        """Drop expired entries; if still full, drop the least recently set"""
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _) in self._data.items() if now >= expires_at]
+        for key in expired:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
@@ -3,49 +3,374 @@ Cal.com API Wrapper
 Handles all interactions with the Cal.com API v2
 """
 
+import asyncio
+import functools
+import hashlib
+import itertools
 import os
+import random
+import tempfile
+import time
+from pathlib import Path
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import httpx
-from dotenv import load_dotenv
+import orjson
 
-load_dotenv()
+from src.cache import TTLCache
+
+# Transient statuses worth retrying at the HTTP layer; anything else is a
+# real error and should surface immediately
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 3
+
+# Hot endpoint paths, interned once; joined with the client's base_url by
+# httpx at send time
+_PATH_EVENT_TYPES = "/event-types"
+_PATH_SLOTS = "/slots/available"
+_PATH_BOOKINGS = "/bookings"
+
+
+# Serialized once; reused for every default-reason cancellation
+_DEFAULT_CANCEL_BODY = orjson.dumps({"cancellationReason": "User requested cancellation"})
+
+# Event types persisted across process restarts; admin-timescale data, so a
+# stale-within-an-hour copy is fine for warming the first turn after boot
+_DISK_CACHE_DIR = Path(tempfile.gettempdir()) / "cal_api_cache"
+_DISK_CACHE_TTL = 3600.0
+
+# "No slots" answers expire faster than positive ones: they absorb the
+# rephrase-and-retry burst but shouldn't hide a slot freed by cancellation
+_SLOTS_NEGATIVE_TTL = 10.0
+
+
+def _iso_utc(value: str) -> str:
+    """Validate an ISO timestamp and normalize it to UTC Z form
+
+    Catching a malformed timestamp here saves a round trip to Cal.com just
+    to learn about it, and the canonical form keeps cache keys consistent:
+    "...T09:00:00+00:00" and "...T09:00:00Z" collapse to one entry.
+    Raises ValueError on unparseable input.
+    """
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _extract_event_types(data: Any) -> List[Dict[str, Any]]:
+    """Flatten the eventTypeGroups envelope into one event-type list"""
+    try:
+        groups = data["eventTypeGroups"]
+    except (TypeError, KeyError):
+        return []
+    return list(itertools.chain.from_iterable(
+        group.get("eventTypes", ()) for group in groups
+    ))
+
+
+def _extract_slots(data: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """Pull the per-date slots mapping out of the availability envelope"""
+    try:
+        return data["slots"]
+    except (TypeError, KeyError):
+        return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Read .env at most once per process, and only when config is missing
+
+    Entrypoints normally call load_dotenv() themselves; this is the fallback
+    for direct library use so a bare CalApiClient() still finds its key
+    without re-scanning .env on every construction.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    return True
+
+
+class _AsyncReader:
+    """File-like adapter feeding an async byte iterator to ijson"""
+
+    def __init__(self, aiter):
+        self._aiter = aiter
+
+    async def read(self, size: int = -1) -> bytes:
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class BookingError(Exception):
+    """A booking request was rejected by Cal.com
+
+    Carries the status code and a bounded slice of the response body so a
+    giant HTML error page never gets fully decoded or held in memory.
+    """
+
+    def __init__(self, status_code: int, detail: str):
+        self.status_code = status_code
+        self.detail = detail
+        super().__init__(f"Cal.com booking failed ({status_code}): {detail}")
 
 
 class CalApiClient:
     """Client for interacting with Cal.com API v2"""
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "headers",
+        "_client",
+        "_owns_client",
+        "_event_types_cache",
+        "_event_types_ttl",
+        "_event_types_lock",
+        "_event_type_index",
+        "_slots_cache",
+        "_inflight",
+    )
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        # Hit the disk for .env only if the key isn't already in the
+        # environment; lru_cache makes repeat constructions free
+        if api_key is None and os.getenv("CAL_API_KEY") is None:
+            _load_env()
+
         self.api_key = api_key or os.getenv("CAL_API_KEY")
         self.base_url = base_url or os.getenv("CAL_API_BASE_URL", "https://api.cal.com/v2")
 
         if not self.api_key:
             raise ValueError("CAL_API_KEY is required")
 
-        self.headers = {
+        # Pre-encoded httpx.Headers, attached once at client construction so
+        # per-request sends skip the dict -> Headers conversion
+        self.headers = httpx.Headers({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, br",  # Compressed JSON listings
             "cal-api-version": "2024-08-13"  # Required for v2 API
-        }
+        })
 
-    async def get_event_types(self) -> List[Dict[str, Any]]:
-        """Get all event types for the authenticated user"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/event-types",
-                headers=self.headers
+        # An injected client shares its connection pool with the caller; we
+        # then attach base_url/auth per request and never close it ourselves
+        self._client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
+
+        # Event types change on admin timescales, so cache them briefly;
+        # the lock collapses concurrent refreshes into a single fetch
+        self._event_types_cache: Optional[tuple] = None
+        self._event_types_ttl = 300.0
+        self._event_types_lock = asyncio.Lock()
+
+        # (source list, by_id, by_slug) — rebuilt only when the TTL cache
+        # above hands back a new list object
+        self._event_type_index: Optional[tuple] = None
+
+        # Availability is stable within a conversation, so identical lookups
+        # in a 30s window come from memory; booking mutations clear it
+        self._slots_cache = TTLCache(maxsize=512, ttl=30.0)
+
+        # Single-flight: concurrent identical lookups share one request
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared HTTP client on first use
+
+        One long-lived client keeps TCP/TLS connections to Cal.com alive
+        across calls instead of paying a fresh handshake per request.
+        """
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            self._owns_client = True
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                http2=True,
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
             )
-            response.raise_for_status()
-            data = response.json()
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a request over the shared client with bounded retries
+
+        A transient 429/502/503/504 or transport error is retried up to
+        three times with exponential backoff plus jitter (honoring
+        Retry-After when sent), so a blip upstream doesn't bubble out and
+        force the caller to redo an entire LLM turn. Only idempotent GETs
+        are retried: a booking POST that timed out may have committed, and
+        resending it could double-book.
+        """
+        client = await self._get_client()
+        path = self._prepare(path, kwargs)
+        retries = _MAX_RETRIES if method == "GET" else 0
+        for attempt in range(retries + 1):
+            try:
+                response = await client.request(method, path, **kwargs)
+            except httpx.TransportError:
+                if attempt == retries:
+                    raise
+                delay = 0.1 * 2 ** attempt + random.random() * 0.05
+            else:
+                if response.status_code not in _RETRY_STATUSES or attempt == retries:
+                    return response
+
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = 0.1 * 2 ** attempt + random.random() * 0.05
+            await asyncio.sleep(delay)
+
+    async def _request_data(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request and return the "data" field of the JSON envelope
+
+        Cal.com v2 wraps every success body as {"status": ..., "data": ...};
+        centralizing the raise/parse/unwrap here keeps the public methods to
+        endpoint-specific shaping only.
+        """
+        response = await self._request(method, path, **kwargs)
+        response.raise_for_status()
+        return orjson.loads(response.content).get("data")
+
+    def _prepare(self, path: str, kwargs: dict) -> str:
+        """Absolutize the URL and attach auth when riding a shared client
+
+        A client this instance built carries base_url and headers itself;
+        a caller-supplied one is generic, so each request brings its own.
+        """
+        if self._owns_client:
+            return path
+        kwargs.setdefault("headers", self.headers)
+        return self.base_url + path
+
+    async def aclose(self):
+        """Close the HTTP client if we own it (call on application shutdown)
+
+        A caller-supplied client is left open; its owner closes it.
+        """
+        if self._owns_client and self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "CalApiClient":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def _disk_cache_path(self) -> Path:
+        """Per-API-key cache file; the key itself never touches the disk"""
+        digest = hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+        return _DISK_CACHE_DIR / f"event_types_{digest}.json"
+
+    def _disk_cache_load(self) -> Optional[List[Dict[str, Any]]]:
+        """Read persisted event types if fresh enough; None on any failure"""
+        try:
+            path = self._disk_cache_path()
+            if time.time() - path.stat().st_mtime >= _DISK_CACHE_TTL:
+                return None
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _disk_cache_store(self, event_types: List[Dict[str, Any]]):
+        """Persist event types for the next process boot; best-effort"""
+        try:
+            _DISK_CACHE_DIR.mkdir(exist_ok=True)
+            self._disk_cache_path().write_bytes(orjson.dumps(event_types))
+        except OSError:
+            pass
+
+    async def get_event_types(self) -> List[Dict[str, Any]]:
+        """Get all event types for the authenticated user (TTL-cached)"""
+        cached = self._event_types_cache
+        if cached and time.monotonic() - cached[0] < self._event_types_ttl:
+            return cached[1]
+
+        async with self._event_types_lock:
+            # Re-check after acquiring: another task may have refreshed
+            cached = self._event_types_cache
+            if cached and time.monotonic() - cached[0] < self._event_types_ttl:
+                return cached[1]
+
+            # Cold start only: serve the persisted copy so the first turn
+            # after boot skips the round trip; in-process refreshes still
+            # go to the network once the memory TTL lapses
+            if cached is None:
+                persisted = self._disk_cache_load()
+                if persisted is not None:
+                    self._event_types_cache = (time.monotonic(), persisted)
+                    return persisted
+
+            data = await self._request_data("GET", _PATH_EVENT_TYPES)
 
             # Cal.com V2 API returns: {status: "success", data: {eventTypeGroups: [...]}}
-            event_types = []
-            if "data" in data:
-                for group in data["data"].get("eventTypeGroups", []):
-                    event_types.extend(group.get("eventTypes", []))
+            event_types = _extract_event_types(data)
 
+            self._event_types_cache = (time.monotonic(), event_types)
+            self._disk_cache_store(event_types)
             return event_types
 
+    async def get_event_type_index(
+        self
+    ) -> tuple[Dict[int, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Get event types indexed by id and by slug for O(1) lookup
+
+        Callers that need a specific event type can hash into these dicts
+        instead of scanning the list each booking turn. The indexes are
+        rebuilt at most once per TTL window, when get_event_types refreshes.
+        """
+        event_types = await self.get_event_types()
+
+        cached = self._event_type_index
+        if cached is None or cached[0] is not event_types:
+            by_id = {et["id"]: et for et in event_types if "id" in et}
+            by_slug = {et["slug"]: et for et in event_types if "slug" in et}
+            cached = (event_types, by_id, by_slug)
+            self._event_type_index = cached
+
+        return cached[1], cached[2]
+
+    async def prefetch_for_booking(
+        self,
+        event_type_id: int,
+        start_time: str,
+        end_time: str,
+        attendee_email: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch everything a booking flow needs in one concurrent round
+
+        The three lookups are independent, so they run via asyncio.gather
+        over the shared client and the total latency is the slowest call
+        instead of the sum of all three.
+
+        Args:
+            event_type_id: The event type ID to check availability for
+            start_time: Start of the availability window (ISO format)
+            end_time: End of the availability window (ISO format)
+            attendee_email: Optional email to filter existing bookings
+        """
+        event_types, slots, bookings = await asyncio.gather(
+            self.get_event_types(),
+            self.get_available_slots(event_type_id, start_time, end_time),
+            self.get_bookings(attendee_email=attendee_email)
+        )
+
+        return {
+            "event_types": event_types,
+            "slots": slots,
+            "bookings": bookings
+        }
+
     async def get_available_slots(
         self,
         event_type_id: int,
@@ -60,27 +385,120 @@ class CalApiClient:
             start_time: Start time in ISO format (e.g., "2024-01-15T00:00:00Z")
             end_time: End time in ISO format (e.g., "2024-01-15T23:59:59Z")
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/slots/available",
-                headers=self.headers,
+        start_time = _iso_utc(start_time)
+        end_time = _iso_utc(end_time)
+
+        cache_key = (event_type_id, start_time, end_time)
+        cached = self._slots_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent identical lookups onto one in-flight request
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            data = await self._request_data(
+                "GET",
+                _PATH_SLOTS,
                 params={
                     "eventTypeId": event_type_id,
                     "startTime": start_time,
                     "endTime": end_time
                 }
             )
-            response.raise_for_status()
-            data = response.json()
 
             # Cal.com V2 API returns: {data: {slots: {"2026-01-12": [{time: "..."}]}}}
-            # We need to flatten this into a simple list
-            slots_by_date = data.get("data", {}).get("slots", {})
-            all_slots = []
-            for date_key, slots_list in slots_by_date.items():
-                all_slots.extend(slots_list)
+            # Flattened into a simple list; chain keeps the loop in C
+            all_slots = list(itertools.chain.from_iterable(_extract_slots(data).values()))
 
+            self._slots_cache.set(
+                cache_key,
+                all_slots,
+                ttl=None if all_slots else _SLOTS_NEGATIVE_TTL
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved even with no waiters
+            raise
+        else:
+            future.set_result(all_slots)
             return all_slots
+        finally:
+            del self._inflight[cache_key]
+
+    async def get_available_slots_multi(
+        self,
+        event_type_id: int,
+        ranges: List[tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch availability for several time ranges concurrently
+
+        Each range rides the shared HTTP/2 connection (and the slots cache),
+        so N lookups cost roughly one round trip instead of N. Concurrency
+        is capped to stay under Cal.com rate limits; ranges that fail are
+        skipped rather than sinking the whole batch.
+
+        Args:
+            event_type_id: The event type ID
+            ranges: List of (start_time, end_time) ISO-format pairs
+
+        Returns:
+            Flattened list of slots across all ranges, in range order
+        """
+        semaphore = asyncio.Semaphore(10)
+
+        async def bounded(start_time: str, end_time: str):
+            async with semaphore:
+                return await self.get_available_slots(event_type_id, start_time, end_time)
+
+        results = await asyncio.gather(
+            *(bounded(start, end) for start, end in ranges),
+            return_exceptions=True
+        )
+
+        all_slots = []
+        for result in results:
+            if not isinstance(result, BaseException):
+                all_slots.extend(result)
+        return all_slots
+
+    async def get_available_slots_range(
+        self,
+        event_type_id: int,
+        start_time: str,
+        end_time: str
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get available slots for a multi-day range in one request
+
+        /slots/available accepts arbitrary ranges, so "what's free next
+        week" is a single round trip instead of one call per day. The API
+        already buckets slots by day, so its mapping is returned as-is.
+
+        Args:
+            event_type_id: The event type ID
+            start_time: Start of the range in ISO format
+            end_time: End of the range in ISO format
+
+        Returns:
+            Dict mapping "YYYY-MM-DD" to that day's slot list
+        """
+        data = await self._request_data(
+            "GET",
+            _PATH_SLOTS,
+            params={
+                "eventTypeId": event_type_id,
+                "startTime": start_time,
+                "endTime": end_time
+            }
+        )
+
+        return _extract_slots(data)
 
     async def create_booking(
         self,
@@ -102,38 +520,36 @@ class CalApiClient:
             attendee_timezone: Timezone of the attendee
             metadata: Additional metadata (e.g., meeting reason)
         """
-        # Build payload according to working examples from Cal.com community
-        # timeZone and language go INSIDE attendee object
-        payload = {
+        # Payload shape per working examples from the Cal.com community:
+        # timeZone and language go INSIDE the attendee object. One fused
+        # literal serialized straight to bytes keeps this a single pass.
+        body = orjson.dumps({
             "eventTypeId": event_type_id,
-            "start": start_time,
+            "start": _iso_utc(start_time),
             "attendee": {
                 "name": attendee_name,
                 "email": attendee_email,
                 "timeZone": attendee_timezone,
                 "language": "en"
-            }
-        }
+            },
+            **({"metadata": metadata} if metadata else {})
+        })
 
-        # Add metadata if provided
-        if metadata:
-            payload["metadata"] = metadata
+        response = await self._request("POST", _PATH_BOOKINGS, content=body)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/bookings",
-                headers=self.headers,
-                json=payload
-            )
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            # Decode at most 2KB of the error body; enough for debugging
+            # without ballooning on an HTML error page
+            detail = e.response.content[:2048].decode("utf-8", "replace")
+            raise BookingError(e.response.status_code, detail) from e
 
-            # Log error details for debugging
-            if response.status_code >= 400:
-                error_body = response.text
-                raise Exception(f"Cal.com booking failed ({response.status_code}): {error_body}")
+        # The new booking consumed a slot; cached availability is now stale
+        self._slots_cache.clear()
 
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
+        data = orjson.loads(response.content)
+        return data.get("data", {})
 
     async def get_bookings(
         self,
@@ -156,53 +572,94 @@ class CalApiClient:
         if attendee_email:
             params["attendeeEmail"] = attendee_email
         if after_start:
-            params["afterStart"] = after_start
+            params["afterStart"] = _iso_utc(after_start)
         if before_start:
-            params["beforeStart"] = before_start
+            params["beforeStart"] = _iso_utc(before_start)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/bookings",
-                headers=self.headers,
-                params=params
-            )
+        data = await self._request_data("GET", _PATH_BOOKINGS, params=params)
+
+        # Cal.com V2 API returns: {status: "success", data: [...]} (direct array)
+        return data if isinstance(data, list) else []
+
+    async def get_bookings_projected(
+        self,
+        fields: set,
+        status: str = "upcoming",
+        attendee_email: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get bookings keeping only the requested top-level fields
+
+        Streams the response through ijson so a large bookings payload never
+        materializes fully: each booking is parsed, projected down to
+        `fields`, and released before the next arrives. Peak memory is the
+        projection, not the payload. The plain get_bookings remains for
+        callers that want whole records.
+
+        Args:
+            fields: Top-level booking keys to keep (e.g. {"uid", "startTime"})
+            status: Filter by status (upcoming, past, cancelled)
+            attendee_email: Filter by attendee email
+        """
+        import ijson  # deferred: only projecting callers pay the import
+
+        params = {"status": status}
+        if attendee_email:
+            params["attendeeEmail"] = attendee_email
+
+        client = await self._get_client()
+        stream_kwargs = {"params": params}
+        path = self._prepare(_PATH_BOOKINGS, stream_kwargs)
+        projected = []
+        async with client.stream("GET", path, **stream_kwargs) as response:
             response.raise_for_status()
-            data = response.json()
+            async for booking in ijson.items(_AsyncReader(response.aiter_bytes()), "data.item"):
+                projected.append({k: booking[k] for k in fields if k in booking})
 
-            # Cal.com V2 API returns: {status: "success", data: [...]} (direct array)
-            if "data" in data:
-                # data["data"] is already a list of bookings
-                return data["data"] if isinstance(data["data"], list) else []
-            return []
+        return projected
 
-    async def cancel_booking(self, booking_uid: str, reason: Optional[str] = None) -> Dict[str, Any]:
+    async def cancel_booking(
+        self,
+        booking_uid: str,
+        reason: Optional[str] = None,
+        await_body: bool = False
+    ) -> Dict[str, Any]:
         """
         Cancel a booking
 
         Args:
             booking_uid: The booking UID (not numeric ID) to cancel
             reason: Optional cancellation reason
+            await_body: Parse and return the response body; the default
+                skips the JSON decode and just reports success
         """
-        # Cancellation reason is required for hosts
-        payload = {
-            "cancellationReason": reason or "User requested cancellation"
-        }
+        # Cancellation reason is required for hosts; the default body is
+        # pre-serialized once at import
+        if reason:
+            body = orjson.dumps({"cancellationReason": reason})
+        else:
+            body = _DEFAULT_CANCEL_BODY
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/bookings/{booking_uid}/cancel",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
+        response = await self._request(
+            "POST", "".join((_PATH_BOOKINGS, "/", booking_uid, "/cancel")), content=body
+        )
+        response.raise_for_status()
+
+        # The freed slot changes availability; drop cached lookups
+        self._slots_cache.clear()
+
+        if not await_body:
+            return {"ok": True}
+
+        data = orjson.loads(response.content)
+        return data.get("data", {})
 
     async def reschedule_booking(
         self,
         booking_uid: str,
         new_start_time: str,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
+        await_body: bool = False
     ) -> Dict[str, Any]:
         """
         Reschedule a booking
@@ -211,19 +668,24 @@ class CalApiClient:
             booking_uid: The booking UID (string) to reschedule
             new_start_time: New start time in ISO format
             reason: Optional rescheduling reason
+            await_body: Parse and return the response body; the default
+                skips the JSON decode and just reports success
         """
-        payload = {
-            "start": new_start_time
-        }
-        if reason:
-            payload["reschedulingReason"] = reason
+        body = orjson.dumps({
+            "start": _iso_utc(new_start_time),
+            **({"reschedulingReason": reason} if reason else {})
+        })
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/bookings/{booking_uid}/reschedule",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
+        response = await self._request(
+            "POST", "".join((_PATH_BOOKINGS, "/", booking_uid, "/reschedule")), content=body
+        )
+        response.raise_for_status()
+
+        # Both the old and new slot changed; drop cached lookups
+        self._slots_cache.clear()
+
+        if not await_body:
+            return {"ok": True}
+
+        data = orjson.loads(response.content)
+        return data.get("data", {})
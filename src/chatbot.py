@@ -2,63 +2,315 @@
 Core chatbot logic with OpenAI function calling
 """
 
+import asyncio
+import functools
+import hashlib
+import logging
 import os
-import json
+import random
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-from dateutil import parser
-import pytz
-from openai import OpenAI
+from datetime import date
+import httpx
+import orjson
+from openai import AsyncOpenAI, RateLimitError
 from dotenv import load_dotenv
 
 from src.cal_api import CalApiClient
+from src.cache import TTLCache
+from src.semantic_cache import SemanticCache
+from src.time_utils import day_bounds_utc
 from src.tools import TOOLS
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Tool classification for response caching: only turns that stayed read-only
+# may be cached, and any mutation invalidates the user's cached replies
+_READ_ONLY_FUNCTIONS = frozenset({"get_available_slots", "get_user_bookings"})
+_MUTATING_FUNCTIONS = frozenset({"create_booking", "cancel_booking", "reschedule_booking"})
+
+_CAPABILITIES_REPLY = (
+    "I can help you manage meetings via Cal.com: book a new meeting, list your "
+    "scheduled meetings, check available time slots, and cancel or reschedule "
+    "existing meetings. Just tell me what you'd like to do!"
+)
+
+# Canned replies for messages that obviously need no tools or reasoning;
+# matching ones skip the LLM round trip entirely. Keys are lowercased,
+# punctuation-stripped user messages.
+SMALLTALK = {
+    "hi": "Hi! I can help you book, view, cancel, or reschedule meetings. What would you like to do?",
+    "hello": "Hello! I can help you book, view, cancel, or reschedule meetings. What would you like to do?",
+    "hey": "Hey! I can help you book, view, cancel, or reschedule meetings. What would you like to do?",
+    "thanks": "You're welcome! Let me know if you need anything else.",
+    "thank you": "You're welcome! Let me know if you need anything else.",
+    "bye": "Goodbye! Feel free to come back whenever you need to manage your meetings.",
+    "goodbye": "Goodbye! Feel free to come back whenever you need to manage your meetings.",
+    "what can you do": _CAPABILITIES_REPLY,
+    "help": _CAPABILITIES_REPLY,
+}
+
+# Kept byte-identical across turns (no interpolated date) so the provider's
+# prompt cache can hit on this shared prefix; dynamic context such as today's
+# date is appended as a separate trailing system message per request
+SYSTEM_PROMPT = """Role: polite Cal.com scheduling assistant. You book, list, cancel, and reschedule meetings via tools.
+
+Rules:
+- Booking needs date, time, attendee email, attendee name, and reason; ask for anything missing, confirm all details before booking, and confirm the result after.
+- Parse natural-language dates/times; assume UTC unless the user says otherwise.
+- Only offer times returned by get_available_slots. If it returns no slots, say there are NO available times that day — never invent times.
+- If a tool result contains an "error" field, the operation FAILED: report the error and never claim success.
+- Format meeting lists readably with date, time, and details.
+"""
+
+
+def _template_reply(function_name: str, result: Any) -> Optional[str]:
+    """Deterministic reply for single-tool turns with an obvious outcome
+
+    Cancellations, reschedules, and slot listings don't need an LLM turn
+    just to phrase a success; rendering them from the tool result halves
+    the LLM round trips for those turns. Returns None for errors, unknown
+    result shapes, or anything needing actual composition — those fall
+    through to the model.
+    """
+    if not isinstance(result, dict) or not result.get("success"):
+        return None
+
+    if function_name == "cancel_booking":
+        return "Your booking has been cancelled."
+
+    if function_name == "reschedule_booking":
+        return "Your booking has been rescheduled."
+
+    if function_name == "get_available_slots":
+        slots = result.get("slots") or []
+        date_str = result.get("date", "")
+        if not slots:
+            return f"There are no available times on {date_str}."
+        times = []
+        for slot in slots[:10]:
+            t = slot.get("time") if isinstance(slot, dict) else None
+            if not t:
+                return None
+            times.append(t[11:16] if len(t) >= 16 else t)
+        more = f" and {len(slots) - 10} more" if len(slots) > 10 else ""
+        return f"Available times on {date_str} (UTC): {', '.join(times)}{more}."
+
+    return None
+
+
+def _history_window(
+    conversation_history: List[Dict[str, str]],
+    limit: int = 12
+) -> List[Dict[str, str]]:
+    """The last `limit` history messages, safe to send to the model
+
+    Only the model sees the window; callers keep (and get back) the full
+    history. The window never starts on a "tool" message — that would
+    orphan it from its assistant tool_calls turn and the API rejects the
+    request — and a leading system message (e.g. an earlier-conversation
+    summary) is always retained.
+    """
+    if len(conversation_history) <= limit:
+        return conversation_history
+
+    start = len(conversation_history) - limit
+    while start < len(conversation_history) and conversation_history[start].get("role") == "tool":
+        start += 1
+
+    window = conversation_history[start:]
+    head = conversation_history[0]
+    if head.get("role") == "system":
+        return [head, *window]
+    return window
+
+
+def _history_context_key(conversation_history: List[Dict[str, str]]) -> str:
+    """Fingerprint of the last two assistant replies for cache scoping"""
+    tail = [
+        m["content"] or ""
+        for m in conversation_history
+        if m.get("role") == "assistant"
+    ][-2:]
+    return "\x1f".join(tail)
+
 
 class CalChatbot:
     """Chatbot that integrates Cal.com with OpenAI function calling"""
 
-    def __init__(self):
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.cal_client = CalApiClient()
-        self.default_event_type_id = os.getenv("CAL_EVENT_TYPE_ID")
+    __slots__ = (
+        "openai_client",
+        "cal_client",
+        "default_event_type_id",
+        "router_model",
+        "responder_model",
+        "max_history_turns",
+        "response_cache",
+        "system_message",
+        "_openai_sem",
+        "_cal_sem",
+        "_slots_tool_cache",
+        "_bookings_tool_cache",
+        "_exact_cache",
+        "_handlers",
+    )
+
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        # Bounded SDK-level retries and timeout; a shared http_client (from
+        # the app lifespan) lets OpenAI traffic reuse the same HTTP/2 pool
+        # as the Cal.com client. The SDK applies its timeout per request,
+        # so the shared client's own default doesn't constrain it.
+        self.openai_client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            max_retries=2,
+            timeout=30.0,
+            http_client=http_client
+        )
+        self.cal_client = CalApiClient(http_client=http_client)
+        _raw_event_type = os.getenv("CAL_EVENT_TYPE_ID")
+        self.default_event_type_id = int(_raw_event_type) if _raw_event_type else None
+
+        # The planning turn (which tools to call, with what arguments) gets
+        # the stronger model; the follow-up turns that just render tool
+        # output as prose use the mini model at a fraction of the latency
+        # and cost. Both are env-overridable independently.
+        self.router_model = os.getenv("CAL_PLANNING_MODEL", "gpt-4-turbo-preview")
+        self.responder_model = os.getenv("CAL_FORMAT_MODEL", "gpt-4o-mini")
+
+        # User/assistant turn pairs kept verbatim; older turns get folded
+        # into a summary message by _compact_history
+        self.max_history_turns = 10
+        self.response_cache = SemanticCache()
+
+        self.system_message = {"role": "system", "content": SYSTEM_PROMPT}
+
+        # Bound concurrent upstream calls so load spikes queue here instead
+        # of turning into 429s; sized for the account's rate tier
+        self._openai_sem = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "10")))
+        self._cal_sem = asyncio.Semaphore(int(os.getenv("CAL_MAX_CONCURRENCY", "20")))
+
+        # Tool-result caches for the read-only functions: repeated identical
+        # calls within a conversation (or across users asking about the same
+        # day) skip the Cal.com round trip entirely. Short TTLs keep the data
+        # fresh, and every mutation helper invalidates below.
+        self._slots_tool_cache = TTLCache(maxsize=256, ttl=60.0)
+        self._bookings_tool_cache = TTLCache(maxsize=1024, ttl=30.0)
+
+        # Exact-match reply cache: catches retries and repeated identical
+        # messages before the similarity scan even runs. TTL-bounded so a
+        # reply can't outlive its data even when no mutation flows through
+        # this process to invalidate it.
+        self._exact_cache = TTLCache(maxsize=512, ttl=300.0)
+
+        # O(1) dispatch for tool calls; every handler takes (args, context)
+        self._handlers = {
+            "get_available_slots": self._get_available_slots,
+            "create_booking": self._create_booking,
+            "get_user_bookings": self._get_user_bookings,
+            "cancel_booking": self._cancel_booking,
+            "reschedule_booking": self._reschedule_booking,
+        }
 
-        # Include current date in system message for better date parsing
-        from datetime import datetime
-        today = datetime.now().strftime("%Y-%m-%d")
+    async def _call_openai(self, **kwargs):
+        """Create a completion under the concurrency cap, retrying 429s
 
-        self.system_message = {
+        Rate-limit errors back off exponentially with jitter for up to five
+        attempts; anything else propagates immediately.
+        """
+        for attempt in range(5):
+            try:
+                async with self._openai_sem:
+                    return await self.openai_client.chat.completions.create(**kwargs)
+            except RateLimitError:
+                if attempt == 4:
+                    raise
+                await asyncio.sleep(0.5 * 2 ** attempt + random.random() * 0.1)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _date_message_for(ordinal: int) -> Dict[str, str]:
+        """One shared date-message dict per calendar day
+
+        Nothing downstream mutates prompt messages, so every request in a
+        day can reuse the same object; the ordinal key rolls it over at
+        midnight.
+        """
+        return {
             "role": "system",
-            "content": f"""You are a helpful meeting scheduling assistant that helps users book, view, cancel, and reschedule meetings using Cal.com.
-
-Today's date is {today}.
-
-Your capabilities:
-1. Book new meetings - Ask for date, time, attendee email, attendee name, and reason
-2. List scheduled meetings - Show user's upcoming meetings
-3. Cancel meetings - Help users cancel existing meetings
-4. Reschedule meetings - Help users move meetings to new times
-
-Important guidelines:
-- Always be polite and conversational
-- When booking, confirm all details before creating the booking
-- Parse natural language dates/times (e.g., "tomorrow at 3pm", "next Monday at 10am")
-- If information is missing, ask the user for it
-- After completing an action, confirm the result to the user
-- For date/time parsing, assume the user is in UTC unless they specify otherwise
-- CRITICAL: When checking available slots, ONLY show times that are returned by the get_available_slots function. If the function returns an empty list or no slots, tell the user there are NO available times for that day. NEVER make up or suggest times that weren't in the API response.
-- CRITICAL: When any function returns an "error" field, the operation FAILED. You MUST tell the user about the error and that the operation was NOT successful. NEVER claim success when there's an error in the function response.
-- When listing meetings, format them in a readable way with date, time, and details
-"""
+            "content": f"Today's date is {date.fromordinal(ordinal).isoformat()}."
         }
 
+    def _date_message(self) -> Dict[str, str]:
+        """Today's date as a trailing system message, kept out of the static
+        system prompt so the cacheable prefix never changes"""
+        return self._date_message_for(date.today().toordinal())
+
+    async def aclose(self):
+        """Release the Cal.com client's pooled connections
+
+        Wire this into the host's shutdown hook (e.g. FastAPI lifespan) so
+        keep-alive connections close cleanly instead of leaking at exit.
+        """
+        await self.cal_client.aclose()
+
+    async def warm_cache(self, user_email: Optional[str] = None):
+        """Pre-populate Cal.com caches before the first message arrives
+
+        Intended to run as a background task while the user types, so the
+        event-types cache (and their bookings, if an email is known) are
+        already warm when the first tool call fires. Errors are swallowed:
+        a failed warm-up just means the first real call pays the fetch.
+        """
+        tasks = [self.cal_client.get_event_types()]
+        if user_email:
+            tasks.append(self.cal_client.get_bookings(attendee_email=user_email))
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _compact_history(self, conversation_history: List[Dict[str, str]]):
+        """Fold history beyond the sliding window into a summary, in place
+
+        Every turn re-sends the whole history, so an unbounded transcript
+        makes prompt cost grow linearly with session length. Once the
+        history exceeds max_history_turns user/assistant pairs, the oldest
+        slice is summarized once and replaced with a single system message;
+        a prior summary at the head just gets folded into the next one.
+        If summarization itself fails, the old slice is dropped outright
+        rather than letting the prompt keep growing.
+        """
+        limit = 2 * self.max_history_turns
+        if len(conversation_history) <= limit:
+            return
+
+        cutoff = len(conversation_history) - limit
+        transcript = "\n".join(
+            f"{m['role']}: {m.get('content') or ''}" for m in conversation_history[:cutoff]
+        )
+        try:
+            response = await self._call_openai(
+                model=self.responder_model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Summarize the following conversation in under 200 tokens. "
+                                   "Keep names, emails, dates, times, and booking details."
+                    },
+                    {"role": "user", "content": transcript}
+                ]
+            )
+            summary = response.choices[0].message.content
+            conversation_history[:cutoff] = [
+                {"role": "system", "content": f"Earlier conversation summary: {summary}"}
+            ]
+        except Exception:
+            del conversation_history[:cutoff]
+
     async def chat(
         self,
         user_message: str,
         conversation_history: List[Dict[str, str]],
-        user_email: Optional[str] = None
+        user_email: Optional[str] = None,
+        max_turns: Optional[int] = None
     ) -> tuple[str, List[Dict[str, str]]]:
         """
         Process a user message and return the chatbot's response
@@ -67,140 +319,494 @@ Important guidelines:
             user_message: The user's message
             conversation_history: Previous conversation messages
             user_email: Optional user email for booking queries
+            max_turns: If set, keep only the last N user/assistant turn pairs
+                in the history so long sessions don't grow prompt size
 
         Returns:
             Tuple of (response message, updated conversation history)
         """
-        # Build messages for OpenAI
-        messages = [self.system_message]
-        messages.extend(conversation_history)
-        messages.append({"role": "user", "content": user_message})
+        # Smalltalk answers come from a canned template, no LLM needed
+        canned = SMALLTALK.get(user_message.strip().lower().rstrip("!?."))
+        if canned is not None:
+            conversation_history.append({"role": "user", "content": user_message})
+            conversation_history.append({"role": "assistant", "content": canned})
+            return canned, conversation_history
+
+        # Exact-repeat fast path: same user, message, and recent history is
+        # a dict hit — cheaper than even the similarity scan below
+        exact_key = hashlib.blake2b(
+            b"|".join((
+                (user_email or "").encode(),
+                user_message.encode(),
+                orjson.dumps(conversation_history[-3:])
+            )),
+            digest_size=16
+        ).hexdigest()
+        cached = self._exact_cache.get(exact_key)
+        if cached is not None:
+            conversation_history.append({"role": "user", "content": user_message})
+            conversation_history.append({"role": "assistant", "content": cached})
+            return cached, conversation_history
+
+        # Near-duplicate read-only questions can skip the LLM entirely; the
+        # context key pins hits to the same recent conversation state so
+        # follow-ups like "yes, that one" never match across contexts
+        context_key = _history_context_key(conversation_history)
+        cached = self.response_cache.get(user_message, user_email, context_key)
+        if cached is not None:
+            conversation_history.append({"role": "user", "content": user_message})
+            conversation_history.append({"role": "assistant", "content": cached})
+            return cached, conversation_history
+
+        # Keep prefill cost flat: fold turns beyond the sliding window into
+        # a one-message summary before they're re-sent yet again
+        await self._compact_history(conversation_history)
+
+        # Build messages for OpenAI in one allocation; the history list
+        # itself stays untouched until the turn completes
+        messages = [
+            self.system_message,
+            self._date_message(),
+            *_history_window(conversation_history),
+            {"role": "user", "content": user_message}
+        ]
 
         # Store user email in context if provided
         context = {"user_email": user_email}
 
+        # Track which tools ran this turn so we know if caching is safe
+        used_functions = set()
+
         # Make initial request to OpenAI
-        response = self.openai_client.chat.completions.create(
-            model="gpt-4-turbo-preview",
+        response = await self._call_openai(
+            model=self.router_model,
             messages=messages,
             tools=TOOLS,
             tool_choice="auto"
         )
 
         assistant_message = response.choices[0].message
+        final_response: Optional[str] = None
 
         # Handle function calls
         while assistant_message.tool_calls:
-            messages.append(assistant_message)
-
-            # Execute each tool call
+            # Plain dict instead of the SDK's Pydantic message object, so the
+            # next request doesn't re-run model_dump over the whole object
+            messages.append({
+                "role": "assistant",
+                "content": assistant_message.content,
+                "tool_calls": [
+                    {
+                        "id": tc.id,
+                        "type": "function",
+                        "function": {
+                            "name": tc.function.name,
+                            "arguments": tc.function.arguments
+                        }
+                    }
+                    for tc in assistant_message.tool_calls
+                ]
+            })
+
+            # Tool calls in one assistant turn are independent, so they run
+            # concurrently: N Cal.com round trips cost max, not sum
+            calls = []
             for tool_call in assistant_message.tool_calls:
                 function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
+                function_args = orjson.loads(tool_call.function.arguments)
+                used_functions.add(function_name)
 
-                print(f"Calling function: {function_name} with args: {function_args}")
+                logger.debug("Calling function %s with args %s", function_name, function_args)
+                calls.append((function_name, function_args))
 
-                # Execute the function
-                try:
-                    result = await self._execute_function(
-                        function_name,
-                        function_args,
-                        context
-                    )
-                    function_response = json.dumps(result)
-                except Exception as e:
-                    function_response = json.dumps({"error": str(e)})
+            results = await self._run_tool_batch(calls, context)
+
+            # Single-tool turns with an obvious outcome skip the formatting
+            # LLM call entirely; composition and errors still go to the model
+            if len(results) == 1 and not isinstance(results[0], BaseException):
+                final_response = _template_reply(calls[0][0], results[0])
+                if final_response is not None:
+                    break
+
+            # gather preserves submission order, so results line up with the
+            # tool_call ids the model expects
+            for tool_call, result in zip(assistant_message.tool_calls, results):
+                if isinstance(result, BaseException):
+                    function_response = orjson.dumps({"error": str(result)}).decode()
+                else:
+                    function_response = orjson.dumps(result).decode()
 
-                # Add function response to messages
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
-                    "name": function_name,
+                    "name": tool_call.function.name,
                     "content": function_response
                 })
 
             # Get next response from OpenAI
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4-turbo-preview",
+            response = await self._call_openai(
+                model=self.responder_model,
                 messages=messages,
                 tools=TOOLS,
                 tool_choice="auto"
             )
             assistant_message = response.choices[0].message
 
-        # Extract final response
-        final_response = assistant_message.content
+        # Extract final response unless a template already produced one
+        if final_response is None:
+            final_response = assistant_message.content
+
+        # Visibility into provider-side prompt-cache hits on the static
+        # system+tools prefix (requires a DEBUG handler to show up)
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        if details is not None:
+            logger.debug(
+                "prompt tokens cached: %s/%s",
+                getattr(details, "cached_tokens", 0),
+                usage.prompt_tokens
+            )
+
+        # The mutation handlers invalidate the reply caches themselves (so
+        # the streaming path is covered too); here we only store replies
+        # from turns that stayed read-only
+        if final_response and not (used_functions & _MUTATING_FUNCTIONS):
+            self._exact_cache.set(exact_key, final_response)
+            if used_functions and used_functions <= _READ_ONLY_FUNCTIONS:
+                self.response_cache.put(user_message, final_response, user_email, context_key)
 
         # Update conversation history
         conversation_history.append({"role": "user", "content": user_message})
         conversation_history.append({"role": "assistant", "content": final_response})
 
+        # Trim in place so callers holding a reference see the bounded list;
+        # dropping the oldest turns keeps the recent (cache-friendly) suffix
+        if max_turns is not None and len(conversation_history) > max_turns * 2:
+            del conversation_history[:-max_turns * 2]
+
         return final_response, conversation_history
 
-    async def _execute_function(
+    async def chat_stream(
         self,
-        function_name: str,
-        arguments: Dict[str, Any],
+        user_message: str,
+        conversation_history: List[Dict[str, str]],
+        user_email: Optional[str] = None
+    ):
+        """
+        Process a user message and yield the reply text incrementally
+
+        Thin wrapper over chat_events for callers that only want the
+        assistant's words (terminal printing, st.write_stream). The caller
+        is responsible for appending the accumulated response to its
+        conversation history.
+
+        Yields:
+            Chunks of the assistant's reply as they arrive from OpenAI
+        """
+        async for event in self.chat_events(
+            user_message, conversation_history, user_email
+        ):
+            if event["type"] == "token":
+                yield event["delta"]
+
+    async def chat_events(
+        self,
+        user_message: str,
+        conversation_history: List[Dict[str, str]],
+        user_email: Optional[str] = None
+    ):
+        """
+        Process a user message and yield framed streaming events
+
+        Runs the same tool-calling loop as chat(), but streams progress as
+        dict events so transport layers (SSE, websockets) can frame them
+        without re-parsing text:
+
+            {"type": "token", "delta": str}          - reply text fragment
+            {"type": "tool_start", "name": str}      - a tool call began
+            {"type": "tool_result", "name": str, "ok": bool}
+            {"type": "done", "response": str}        - full accumulated reply
+
+        The caller is responsible for appending the final response to its
+        conversation history.
+
+        Args:
+            user_message: The user's message
+            conversation_history: Previous conversation messages
+            user_email: Optional user email for booking queries
+        """
+        # Smalltalk answers come from a canned template, no LLM needed
+        canned = SMALLTALK.get(user_message.strip().lower().rstrip("!?."))
+        if canned is not None:
+            yield {"type": "token", "delta": canned}
+            yield {"type": "done", "response": canned}
+            return
+
+        # Build messages for OpenAI in one allocation
+        messages = [
+            self.system_message,
+            self._date_message(),
+            *_history_window(conversation_history),
+            {"role": "user", "content": user_message}
+        ]
+
+        # Store user email in context if provided
+        context = {"user_email": user_email}
+
+        parts: List[str] = []
+        first_call = True
+
+        while True:
+            stream = await self._call_openai(
+                model=self.router_model if first_call else self.responder_model,
+                messages=messages,
+                tools=TOOLS,
+                tool_choice="auto",
+                stream=True
+            )
+            first_call = False
+
+            # Accumulate streamed tool-call fragments by index; OpenAI sends
+            # function arguments as partial JSON strings that must be
+            # concatenated before parsing. As soon as a call's arguments
+            # parse, it is dispatched as a task so the Cal.com round trip
+            # overlaps with the rest of the token stream.
+            tool_calls: Dict[int, Dict[str, str]] = {}
+            tasks: Dict[int, asyncio.Task] = {}
+            finish_reason = None
+
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta
+
+                if delta.content:
+                    parts.append(delta.content)
+                    yield {"type": "token", "delta": delta.content}
+
+                for tc in delta.tool_calls or []:
+                    call = tool_calls.setdefault(
+                        tc.index, {"id": "", "name": "", "arguments": ""}
+                    )
+                    if tc.id:
+                        call["id"] = tc.id
+                    if tc.function:
+                        if tc.function.name:
+                            call["name"] = tc.function.name
+                        if tc.function.arguments:
+                            call["arguments"] += tc.function.arguments
+
+                    if tc.index not in tasks and call["name"] and call["arguments"]:
+                        try:
+                            args = orjson.loads(call["arguments"])
+                        except orjson.JSONDecodeError:
+                            continue  # arguments still streaming
+                        logger.debug("Calling function %s with args %s", call["name"], args)
+                        tasks[tc.index] = asyncio.create_task(
+                            self._execute_function(call["name"], args, context)
+                        )
+                        yield {"type": "tool_start", "name": call["name"]}
+
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+            if finish_reason != "tool_calls":
+                for task in tasks.values():
+                    task.cancel()
+                yield {"type": "done", "response": "".join(parts)}
+                break
+
+            # Backstop for calls whose arguments never parsed mid-stream
+            # (e.g. an empty-argument call): dispatch them now
+            for index, call in tool_calls.items():
+                if index not in tasks:
+                    args = orjson.loads(call["arguments"] or "{}")
+                    logger.debug("Calling function %s with args %s", call["name"], args)
+                    tasks[index] = asyncio.create_task(
+                        self._execute_function(call["name"], args, context)
+                    )
+                    yield {"type": "tool_start", "name": call["name"]}
+
+            # Re-assemble the assistant tool-call message for the next request
+            ordered_calls = [call for _, call in sorted(tool_calls.items())]
+            messages.append({
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call["id"],
+                        "type": "function",
+                        "function": {
+                            "name": call["name"],
+                            "arguments": call["arguments"]
+                        }
+                    }
+                    for call in ordered_calls
+                ]
+            })
+
+            # Collect results in index order; most tasks finished while the
+            # stream was still delivering tokens
+            for index, call in sorted(tool_calls.items()):
+                function_name = call["name"]
+                try:
+                    result = await tasks[index]
+                    function_response = orjson.dumps(result).decode()
+                    ok = "error" not in result
+                except Exception as e:
+                    function_response = orjson.dumps({"error": str(e)}).decode()
+                    ok = False
+
+                yield {"type": "tool_result", "name": function_name, "ok": ok}
+
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": call["id"],
+                    "name": function_name,
+                    "content": function_response
+                })
+
+    async def _run_tool_batch(
+        self,
+        calls: List[tuple],
         context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Execute a function call"""
+    ) -> List[Any]:
+        """Run one assistant turn's tool calls concurrently
+
+        Multi-day availability probes ("any time this week?" fans out into
+        one get_available_slots call per day) are coalesced: all calls for
+        the same event type within a 14-day span share a single ranged
+        Cal.com query, partitioned back into per-call results locally.
+        Exceptions are returned in place of results, mirroring gather with
+        return_exceptions.
+        """
+        coros: List[Any] = [None] * len(calls)
+
+        # Group slot lookups by resolved event type
+        slot_groups: Dict[int, List[int]] = {}
+        for i, (name, args) in enumerate(calls):
+            if name == "get_available_slots" and "date" in args:
+                event_type_id = args.get("event_type_id")
+                event_type_id = int(event_type_id) if event_type_id else self.default_event_type_id
+                if event_type_id:
+                    slot_groups.setdefault(event_type_id, []).append(i)
+
+        for event_type_id, indices in slot_groups.items():
+            if len(indices) < 2:
+                continue
+            dates = sorted({calls[i][1]["date"] for i in indices})
+            try:
+                span = (date.fromisoformat(dates[-1]) - date.fromisoformat(dates[0])).days
+            except ValueError:
+                continue
+            if span == 0 or span > 14:
+                continue
+            task = asyncio.create_task(
+                self._get_slots_ranged(event_type_id, dates[0], dates[-1])
+            )
+            for i in indices:
+                coros[i] = self._slots_from_range(task, event_type_id, calls[i][1]["date"])
 
-        if function_name == "get_available_slots":
-            return await self._get_available_slots(arguments)
+        for i, (name, args) in enumerate(calls):
+            if coros[i] is None:
+                coros[i] = self._execute_function(name, args, context)
 
-        elif function_name == "create_booking":
-            return await self._create_booking(arguments)
+        return await asyncio.gather(*coros, return_exceptions=True)
 
-        elif function_name == "get_user_bookings":
-            return await self._get_user_bookings(arguments, context)
+    async def _get_slots_ranged(
+        self,
+        event_type_id: int,
+        first_date: str,
+        last_date: str
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """One ranged availability query covering several probed days"""
+        async with self._cal_sem:
+            return await self.cal_client.get_available_slots_range(
+                event_type_id=event_type_id,
+                start_time=f"{first_date}T00:00:00Z",
+                end_time=f"{last_date}T23:59:59Z"
+            )
 
-        elif function_name == "cancel_booking":
-            return await self._cancel_booking(arguments)
+    async def _slots_from_range(
+        self,
+        task: "asyncio.Task",
+        event_type_id: int,
+        date_str: str
+    ) -> Dict[str, Any]:
+        """Project one day's result out of a shared ranged query"""
+        try:
+            by_date = await task
+        except Exception as e:
+            return {"error": f"Failed to get available slots: {str(e)}"}
+
+        result = {
+            "success": True,
+            "date": date_str,
+            "slots": by_date.get(date_str, [])
+        }
+        self._slots_tool_cache.set((event_type_id, date_str), result)
+        return result
 
-        elif function_name == "reschedule_booking":
-            return await self._reschedule_booking(arguments)
+    async def _execute_function(
+        self,
+        function_name: str,
+        arguments: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute a function call (bounded by the Cal.com concurrency cap)"""
 
-        else:
+        handler = self._handlers.get(function_name)
+        if handler is None:
             return {"error": f"Unknown function: {function_name}"}
+        async with self._cal_sem:
+            return await handler(arguments, context)
 
-    async def _get_available_slots(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_available_slots(self, args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Get available time slots for a date"""
         date_str = args["date"]
-        event_type_id = args.get("event_type_id") or self.default_event_type_id
+        event_type_id = args.get("event_type_id")
+        event_type_id = int(event_type_id) if event_type_id else self.default_event_type_id
 
         if not event_type_id:
             return {"error": "Event type ID not configured"}
 
-        # Parse date and create time range for the day
+        cache_key = (event_type_id, date_str)
+        cached = self._slots_tool_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Cached day bounds avoid re-parsing the same date every call
         try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            start_time = date.replace(hour=0, minute=0, second=0).isoformat() + "Z"
-            end_time = date.replace(hour=23, minute=59, second=59).isoformat() + "Z"
+            start_time, end_time = day_bounds_utc(date_str)
 
             slots = await self.cal_client.get_available_slots(
-                event_type_id=int(event_type_id),
+                event_type_id=event_type_id,
                 start_time=start_time,
                 end_time=end_time
             )
 
-            return {
+            result = {
                 "success": True,
                 "date": date_str,
                 "slots": slots
             }
+            self._slots_tool_cache.set(cache_key, result)
+            return result
         except Exception as e:
             return {"error": f"Failed to get available slots: {str(e)}"}
 
-    async def _create_booking(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _create_booking(self, args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new booking"""
-        event_type_id = args.get("event_type_id") or self.default_event_type_id
+        event_type_id = args.get("event_type_id")
+        event_type_id = int(event_type_id) if event_type_id else self.default_event_type_id
 
         if not event_type_id:
             return {"error": "Event type ID not configured"}
 
         try:
             booking = await self.cal_client.create_booking(
-                event_type_id=int(event_type_id),
+                event_type_id=event_type_id,
                 start_time=args["start_time"],
                 attendee_email=args["attendee_email"],
                 attendee_name=args["attendee_name"],
@@ -208,6 +814,16 @@ Important guidelines:
                 metadata={"reason": args.get("reason", "")}
             )
 
+            # The booked day's slots and the user's booking list just
+            # changed; cached replies for the requester and the attendee
+            # ("your meetings are...") are stale too. Invalidating here
+            # covers chat() and the streaming path alike.
+            self._slots_tool_cache.pop((event_type_id, args["start_time"][:10]))
+            self._bookings_tool_cache.clear()
+            self._exact_cache.clear()
+            self.response_cache.invalidate(context.get("user_email"))
+            self.response_cache.invalidate(args["attendee_email"])
+
             return {
                 "success": True,
                 "booking": booking
@@ -227,14 +843,19 @@ Important guidelines:
             if not user_email:
                 return {"error": "User email is required but not provided"}
 
+            cache_key = (user_email, status, after_date, before_date)
+            cached = self._bookings_tool_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             # Convert dates to ISO format if provided
             after_start = None
             before_start = None
 
             if after_date:
-                after_start = datetime.strptime(after_date, "%Y-%m-%d").isoformat() + "Z"
+                after_start = day_bounds_utc(after_date)[0]
             if before_date:
-                before_start = datetime.strptime(before_date, "%Y-%m-%d").isoformat() + "Z"
+                before_start = day_bounds_utc(before_date)[0]
 
             bookings = await self.cal_client.get_bookings(
                 status=status,
@@ -243,15 +864,17 @@ Important guidelines:
                 before_start=before_start
             )
 
-            return {
+            result = {
                 "success": True,
                 "bookings": bookings,
                 "count": len(bookings)
             }
+            self._bookings_tool_cache.set(cache_key, result)
+            return result
         except Exception as e:
             return {"error": f"Failed to get bookings: {str(e)}"}
 
-    async def _cancel_booking(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _cancel_booking(self, args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Cancel a booking"""
         try:
             # Cal.com API requires booking UID (string), not numeric ID
@@ -262,6 +885,13 @@ Important guidelines:
                 reason=args.get("reason")
             )
 
+            # No event type/date on hand for a cancel, so drop everything,
+            # cached replies included (covers the streaming path too)
+            self._slots_tool_cache.clear()
+            self._bookings_tool_cache.clear()
+            self._exact_cache.clear()
+            self.response_cache.invalidate(context.get("user_email"))
+
             return {
                 "success": True,
                 "result": result
@@ -269,7 +899,7 @@ Important guidelines:
         except Exception as e:
             return {"error": f"Failed to cancel booking: {str(e)}"}
 
-    async def _reschedule_booking(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _reschedule_booking(self, args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Reschedule a booking"""
         try:
             # Use UID if provided, otherwise try to convert ID to string
@@ -281,6 +911,13 @@ Important guidelines:
                 reason=args.get("reason")
             )
 
+            # A reschedule frees one day and fills another; drop everything,
+            # cached replies included (covers the streaming path too)
+            self._slots_tool_cache.clear()
+            self._bookings_tool_cache.clear()
+            self._exact_cache.clear()
+            self.response_cache.invalidate(context.get("user_email"))
+
             return {
                 "success": True,
                 "result": result
@@ -2,25 +2,101 @@
 FastAPI server for Cal.com chatbot
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from contextlib import asynccontextmanager
+from dotenv import load_dotenv
+import httpx
+import orjson
+import os
+import logging
+import logging.handlers
+import queue
 import uvicorn
 
-from src.models import ChatRequest, ChatResponse, ChatMessage
+# Load .env once at the process entrypoint; library modules read os.environ
+load_dotenv()
+
+# uvicorn[standard] ships uvloop and uses it by default; installing it here
+# too covers running this module directly under plain asyncio
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+from src.cache import TTLCache
+from src.models import ChatRequest, ChatResponse
+from src.orjson_response import ORJSONResponse
 from src.chatbot import CalChatbot
 
-# Global chatbot instance
-chatbot = None
+# Server-side conversation histories keyed by conversation_id, so clients can
+# send only the new message each turn instead of the full transcript.
+# TTL-bounded: every CLI run mints a fresh id and most are never /reset, so
+# a plain dict would grow with total client count; idle conversations are
+# evicted after an hour instead.
+_sessions = TTLCache(maxsize=1024, ttl=3600.0)
+
+# Server-side histories get the same rolling bound as client-supplied ones
+# (ChatRequest caps at 40); CalChatbot folds older turns into a summary
+# message before they age out, so dropping the tail loses no context
+_SESSION_MAX_MESSAGES = 50
+
+
+def _trim_session(history: list) -> None:
+    """Drop the oldest messages beyond the rolling session bound"""
+    del history[:-_SESSION_MAX_MESSAGES]
+
+
+def _get_history(request: ChatRequest) -> list:
+    """Resolve the conversation history for a request"""
+    if request.conversation_id:
+        history = _sessions.get(request.conversation_id)
+        if history is None:
+            history = []
+        # Re-set on every touch so the idle clock restarts with each turn
+        _sessions.set(request.conversation_id, history)
+        return history
+    # Single pydantic-core dump instead of a per-message dict comprehension
+    return request.model_dump(include={"conversation_history"})["conversation_history"]
+
+
+def get_chatbot(request: Request) -> CalChatbot:
+    """Dependency resolving the per-app chatbot instance"""
+    return request.app.state.chatbot
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup chatbot"""
-    global chatbot
-    chatbot = CalChatbot()
+    # Route app log records through a queue so formatting and stream I/O
+    # happen on the listener's thread instead of blocking the event loop
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    logging.getLogger("src").addHandler(logging.handlers.QueueHandler(log_queue))
+
+    # One process-wide HTTP client: TLS handshakes are amortized across all
+    # requests and concurrent tool calls multiplex over HTTP/2
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=50)
+    )
+    app.state.chatbot = CalChatbot(http_client=http_client)
+
+    # Pre-warm the connection so the first tool call skips the handshake
+    try:
+        await http_client.get(app.state.chatbot.cal_client.base_url)
+    except httpx.HTTPError:
+        pass
+
     print("Chatbot initialized")
     yield
+    await app.state.chatbot.aclose()
+    await http_client.aclose()
+    listener.stop()
     print("Shutting down")
 
 
@@ -29,7 +105,8 @@ app = FastAPI(
     title="Cal.com Chatbot API",
     description="Interactive chatbot for booking meetings via Cal.com",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -42,27 +119,33 @@ app.add_middleware(
 )
 
 
+# Constant bodies encoded once at import; health checks hit these dozens of
+# times per second and shouldn't pay validation or encoding each time
+_ROOT_BYTES = orjson.dumps({
+    "message": "Cal.com Chatbot API",
+    "version": "1.0.0",
+    "endpoints": {
+        "chat": "/chat",
+        "health": "/health"
+    }
+})
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Cal.com Chatbot API",
-        "version": "1.0.0",
-        "endpoints": {
-            "chat": "/chat",
-            "health": "/health"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint"""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, chatbot: CalChatbot = Depends(get_chatbot)):
     """
     Chat endpoint for interacting with the chatbot
 
@@ -74,7 +157,7 @@ async def chat(request: ChatRequest):
     """
     try:
         # Convert Pydantic models to dicts for chatbot
-        history = [{"role": msg.role, "content": msg.content} for msg in request.conversation_history]
+        history = _get_history(request)
 
         # Get response from chatbot
         response, updated_history = await chatbot.chat(
@@ -82,27 +165,87 @@ async def chat(request: ChatRequest):
             conversation_history=history,
             user_email=request.user_email
         )
-
-        # Convert back to Pydantic models
-        history_models = [ChatMessage(role=msg["role"], content=msg["content"]) for msg in updated_history]
-
-        return ChatResponse(
-            response=response,
-            conversation_history=history_models
+        if request.conversation_id:
+            _trim_session(history)
+
+        # Returning a Response directly skips jsonable_encoder's per-message
+        # walk and response-model revalidation; the data is our own output.
+        # response_model stays on the decorator purely for the OpenAPI docs.
+        return Response(
+            content=orjson.dumps({
+                "response": response,
+                "conversation_history": updated_history
+            }),
+            media_type="application/json"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
 
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest, chatbot: CalChatbot = Depends(get_chatbot)):
+    """
+    Streaming chat endpoint
+
+    Sends the assistant's reply incrementally as server-sent events. Reply
+    text arrives as `data: {"type": "token", "delta": ...}`, tool progress
+    as `tool_start`/`tool_result` frames, and the final frame is
+    `data: {"type": "done", "response": ...}` with the full reply, followed
+    by a `history` frame carrying the updated conversation history.
+    """
+    history = _get_history(request)
+
+    async def event_stream():
+        try:
+            async for event in chatbot.chat_events(
+                user_message=request.message,
+                conversation_history=history,
+                user_email=request.user_email
+            ):
+                # chat_events doesn't touch the history itself; record the
+                # turn (server-side sessions keep it for the next request)
+                if event["type"] == "done":
+                    history.append({"role": "user", "content": request.message})
+                    history.append({"role": "assistant", "content": event["response"]})
+                    if request.conversation_id:
+                        _trim_session(history)
+
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
+
+                if event["type"] == "done":
+                    # Trailer so clients don't have to reassemble the turn
+                    yield b"data: " + orjson.dumps(
+                        {"type": "history", "conversation_history": history}
+                    ) + b"\n\n"
+        except Exception as e:
+            yield b"data: " + orjson.dumps({"type": "error", "error": str(e)}) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/reset")
-async def reset_conversation():
+async def reset_conversation(conversation_id: str = None):
     """Reset the conversation history"""
+    if conversation_id:
+        _sessions.pop(conversation_id, None)
+        return {"message": f"Conversation {conversation_id} reset"}
     return {"message": "To reset conversation, simply stop sending conversation_history in your requests"}
 
 
 def start_server(host: str = "0.0.0.0", port: int = 8000):
     """Start the FastAPI server"""
-    uvicorn.run(app, host=host, port=port)
+    workers = int(os.getenv("WEB_WORKERS", "1"))
+    uvicorn.run(
+        # Multi-worker mode needs the import string; each worker then runs
+        # its own lifespan and builds its own chatbot/pool
+        "src.main:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        log_level=os.getenv("LOG_LEVEL", "warning")
+    )
 
 
 if __name__ == "__main__":
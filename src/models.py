@@ -2,32 +2,56 @@
 Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
 
 class ChatMessage(BaseModel):
     """Chat message model"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     role: str = Field(..., description="Role of the message sender (user, assistant, system)")
     content: str = Field(..., description="Content of the message")
 
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     message: str = Field(..., description="User message")
     conversation_history: List[ChatMessage] = Field(default_factory=list, description="Previous conversation history")
+    conversation_id: Optional[str] = Field(None, description="Client-generated conversation ID; when set, history is kept server-side and conversation_history is ignored")
     user_email: Optional[str] = Field(None, description="User's email for booking queries")
 
+    @field_validator("conversation_history")
+    @classmethod
+    def _cap_history(cls, value: List[ChatMessage]) -> List[ChatMessage]:
+        """Keep only the most recent 40 messages
+
+        Caps memory and token cost at the API boundary; clients wanting a
+        longer memory should use server-side sessions via conversation_id.
+        """
+        return value[-40:]
+
 
 class ChatResponse(BaseModel):
     """Response model for chat endpoint"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     response: str = Field(..., description="Chatbot response")
     conversation_history: List[ChatMessage] = Field(..., description="Updated conversation history")
 
 
-class BookingDetails(BaseModel):
-    """Booking details model"""
+@dataclass(frozen=True, slots=True)
+class BookingDetails:
+    """Booking details record
+
+    Plain slotted dataclass rather than a Pydantic model: these are shaped
+    from Cal.com responses we already trust, never validated at the API
+    boundary, and can number in the hundreds per listing — slots drop the
+    per-instance __dict__.
+    """
     id: int
     event_type_id: int
     title: str
@@ -37,7 +61,8 @@ class BookingDetails(BaseModel):
     attendees: List[Dict[str, Any]]
 
 
-class AvailableSlot(BaseModel):
-    """Available time slot model"""
+@dataclass(frozen=True, slots=True)
+class AvailableSlot:
+    """Available time slot record"""
     time: str
     available: bool
@@ -0,0 +1,23 @@
+"""
+orjson-backed JSON response class for FastAPI
+
+FastAPI's bundled ORJSONResponse serializes with orjson's defaults, which
+reject datetimes rendered by exotic types and naive timestamps coming back
+from Cal.com payloads. This variant stamps naive datetimes as UTC and
+falls back to str() for anything orjson doesn't handle natively, matching
+what the stdlib encoder would have produced.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NAIVE_UTC)
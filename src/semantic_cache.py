@@ -0,0 +1,139 @@
+"""
+Semantic cache for chatbot responses
+
+Caches assistant replies keyed by the user's message so near-duplicate
+questions ("show my meetings" vs "list my scheduled events") can be answered
+without another LLM round trip. Similarity is lexical: messages are reduced
+to content tokens (stopwords dropped, domain synonyms collapsed) and
+compared by token-set Jaccard, which keeps the cache dependency-free while
+still catching real rephrasings. Two messages additionally never match
+unless they express the same intent (book vs cancel vs list...), so a high
+wording overlap can't cross action boundaries.
+"""
+
+import re
+import time
+from typing import Optional
+
+# Similarity threshold over content tokens. After stopword removal and
+# synonym folding, paraphrases of the same request collapse to nearly the
+# same small set, while a single differing detail token (a date, a time, a
+# name) in a short message drops the score to 0.5 or below.
+DEFAULT_THRESHOLD = 0.6
+
+# ISO dates and clock times stay whole tokens; split into digit groups they
+# would share year/month or minute fragments across genuinely different
+# questions and inflate the similarity score
+_TOKEN_RE = re.compile(r"\d{4}-\d{2}-\d{2}|\d{1,2}:\d{2}|[a-z0-9']+")
+
+# Filler that carries no meaning for matching; without this, politeness and
+# phrasing ("please", "can you", "do I have") dominate the Jaccard score
+_STOPWORDS = frozenset(
+    "a an the my me i you your it is are do does have has had what which who "
+    "can could would will shall should please show tell give me get list see "
+    "view check find of for to on at in with any all "
+    # "scheduled"/"upcoming" just restate the default booking status
+    "scheduled upcoming".split()
+)
+
+# Interchangeable domain words, folded to one canonical token each so
+# "show my bookings" and "what meetings do I have" produce identical sets
+_SYNONYMS = {
+    word: canonical
+    for canonical, words in {
+        "book": ("book", "schedule", "reserve", "set", "arrange"),
+        "cancel": ("cancel", "delete", "remove", "drop"),
+        "reschedule": ("reschedule", "move", "change", "shift"),
+        "slots": ("slots", "slot", "availability", "available", "free", "openings", "times"),
+        "meetings": ("meetings", "meeting", "bookings", "booking", "events", "event",
+                     "appointments", "appointment", "calls", "call"),
+    }.items()
+    for word in words
+}
+
+# The canonical tokens double as the message's intent signature
+_INTENT_TOKENS = frozenset(_SYNONYMS.values())
+
+
+def _tokenize(text: str) -> frozenset:
+    """Reduce a message to canonical lowercase content tokens"""
+    return frozenset(
+        _SYNONYMS.get(token, token)
+        for token in _TOKEN_RE.findall(text.lower())
+        if token not in _STOPWORDS
+    )
+
+
+def _similarity(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity between two token sets"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class SemanticCache:
+    """In-memory cache of chatbot replies to near-duplicate questions
+
+    Entries are stored per user_email so one user's data never answers
+    another user's question. Callers must only store replies from read-only
+    turns and should invalidate a user's entries after any mutation.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, ttl: float = 300.0, maxsize: int = 128):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # user_email -> list of (tokens, context_key, response, timestamp)
+        self._entries = {}
+
+    def get(
+        self,
+        user_message: str,
+        user_email: Optional[str] = None,
+        context_key: str = ""
+    ) -> Optional[str]:
+        """Return a cached reply for a similar enough message, if any
+
+        context_key fingerprints the surrounding conversation (e.g. the last
+        couple of assistant replies); a hit requires it to match exactly, so
+        "yes, that one" style messages can't be answered out of context.
+        """
+        entries = self._prune(user_email)
+        if not entries:
+            return None
+
+        tokens = _tokenize(user_message)
+        intent = tokens & _INTENT_TOKENS
+        for cached_tokens, cached_context, response, _ in reversed(entries):
+            if (
+                cached_context == context_key
+                and cached_tokens & _INTENT_TOKENS == intent
+                and _similarity(tokens, cached_tokens) >= self.threshold
+            ):
+                return response
+        return None
+
+    def put(
+        self,
+        user_message: str,
+        response: str,
+        user_email: Optional[str] = None,
+        context_key: str = ""
+    ):
+        """Store a reply for later reuse"""
+        entries = self._prune(user_email)
+        entries.append((_tokenize(user_message), context_key, response, time.monotonic()))
+        if len(entries) > self.maxsize:
+            del entries[0]
+
+    def invalidate(self, user_email: Optional[str] = None):
+        """Drop all entries for a user (call after any booking mutation)"""
+        self._entries.pop(user_email or "", None)
+
+    def _prune(self, user_email: Optional[str]) -> list:
+        """Drop expired entries and return the user's live entry list"""
+        key = user_email or ""
+        now = time.monotonic()
+        entries = [e for e in self._entries.get(key, []) if now - e[3] < self.ttl]
+        self._entries[key] = entries
+        return entries
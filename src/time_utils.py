@@ -0,0 +1,55 @@
+"""
+UTC time-window helpers
+
+The chatbot repeatedly turns "YYYY-MM-DD" strings into ISO day/week bounds
+for Cal.com queries. These helpers validate and format a date once, then
+serve repeat lookups for the same date from an lru_cache instead of paying
+strptime/isoformat churn on every call.
+"""
+
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+
+# Shape gate: guarantees the string can be embedded in the ISO bounds
+# verbatim (fromisoformat alone would also accept compact "YYYYMMDD")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@lru_cache(maxsize=64)
+def day_bounds_utc(date_str: str) -> tuple[str, str]:
+    """ISO UTC bounds covering one calendar day
+
+    Args:
+        date_str: Date in "YYYY-MM-DD" format
+
+    Returns:
+        Tuple of (start, end) ISO strings, e.g.
+        ("2024-01-15T00:00:00Z", "2024-01-15T23:59:59Z")
+    """
+    if not _DATE_RE.fullmatch(date_str):
+        raise ValueError(f"Invalid isoformat string: {date_str!r}")
+    # Shape isn't enough — "2026-02-30" must fail fast here with a clean
+    # ValueError instead of going out to Cal.com; the lru_cache already
+    # amortizes the parse across repeat lookups of the same date
+    date.fromisoformat(date_str)
+    return (f"{date_str}T00:00:00Z", f"{date_str}T23:59:59Z")
+
+
+@lru_cache(maxsize=64)
+def week_bounds_utc(date_str: str) -> tuple[str, str]:
+    """ISO UTC bounds covering the Monday-Sunday week containing a date
+
+    Args:
+        date_str: Date in "YYYY-MM-DD" format
+
+    Returns:
+        Tuple of (start, end) ISO strings for the surrounding week
+    """
+    day = date.fromisoformat(date_str)
+    monday = day - timedelta(days=day.weekday())
+    sunday = monday + timedelta(days=6)
+    return (
+        f"{monday.isoformat()}T00:00:00Z",
+        f"{sunday.isoformat()}T23:59:59Z"
+    )
@@ -2,25 +2,30 @@
 OpenAI function calling tool definitions for Cal.com integration
 """
 
-from typing import List, Dict, Any
+from typing import Dict, Any
 
-# Tool definitions for OpenAI function calling
-TOOLS: List[Dict[str, Any]] = [
+import orjson
+
+# Tool definitions for OpenAI function calling. The whole schema rides in
+# every request's prompt, so descriptions are kept terse — one short
+# sentence each — and byte-identical across calls for provider-side
+# prompt caching. A tuple: the schemas are never mutated.
+TOOLS: tuple[Dict[str, Any], ...] = (
     {
         "type": "function",
         "function": {
             "name": "get_available_slots",
-            "description": "Get available time slots for booking a meeting. Use this when the user wants to book a meeting and you need to check availability.",
+            "description": "Get available time slots for a date before booking a meeting.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "date": {
                         "type": "string",
-                        "description": "The date to check availability for, in YYYY-MM-DD format (e.g., '2024-01-15')"
+                        "description": "Date to check, YYYY-MM-DD"
                     },
                     "event_type_id": {
                         "type": "integer",
-                        "description": "The event type ID to check availability for. If not provided, use the default from environment."
+                        "description": "Event type ID; omit to use the default"
                     }
                 },
                 "required": ["date"]
@@ -31,33 +36,33 @@ TOOLS: List[Dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "create_booking",
-            "description": "Create a new booking/meeting. Use this after confirming the time slot is available and you have all necessary details (date, time, attendee info, reason).",
+            "description": "Create a booking once slot availability and attendee details are confirmed.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "start_time": {
                         "type": "string",
-                        "description": "The start time of the meeting in ISO 8601 format (e.g., '2024-01-15T14:00:00Z')"
+                        "description": "Start time, ISO 8601 (e.g. '2024-01-15T14:00:00Z')"
                     },
                     "attendee_email": {
                         "type": "string",
-                        "description": "Email address of the attendee booking the meeting"
+                        "description": "Attendee's email address"
                     },
                     "attendee_name": {
                         "type": "string",
-                        "description": "Full name of the attendee"
+                        "description": "Attendee's full name"
                     },
                     "reason": {
                         "type": "string",
-                        "description": "Reason or description for the meeting"
+                        "description": "Reason for the meeting"
                     },
                     "event_type_id": {
                         "type": "integer",
-                        "description": "The event type ID. If not provided, use the default from environment."
+                        "description": "Event type ID; omit to use the default"
                     },
                     "timezone": {
                         "type": "string",
-                        "description": "Timezone of the attendee (e.g., 'America/New_York', 'UTC'). Defaults to UTC."
+                        "description": "Attendee's IANA timezone; defaults to UTC"
                     }
                 },
                 "required": ["start_time", "attendee_email", "attendee_name", "reason"]
@@ -68,26 +73,26 @@ TOOLS: List[Dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "get_user_bookings",
-            "description": "Get a list of scheduled bookings/meetings for a user. Use this when the user asks to see their scheduled events or meetings. The user's email will be automatically used from context.",
+            "description": "List a user's scheduled meetings; email is taken from context if omitted.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "user_email": {
                         "type": "string",
-                        "description": "Email address of the user to get bookings for (optional, will use user's email from context if not provided)"
+                        "description": "User's email; defaults to the conversation's user"
                     },
                     "status": {
                         "type": "string",
                         "enum": ["upcoming", "past", "cancelled"],
-                        "description": "Filter bookings by status. Defaults to 'upcoming'."
+                        "description": "Status filter; defaults to 'upcoming'"
                     },
                     "after_date": {
                         "type": "string",
-                        "description": "Only get bookings after this date in YYYY-MM-DD format"
+                        "description": "Only bookings after this date, YYYY-MM-DD"
                     },
                     "before_date": {
                         "type": "string",
-                        "description": "Only get bookings before this date in YYYY-MM-DD format"
+                        "description": "Only bookings before this date, YYYY-MM-DD"
                     }
                 },
                 "required": []
@@ -98,13 +103,13 @@ TOOLS: List[Dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "cancel_booking",
-            "description": "Cancel a scheduled booking/meeting. First use get_user_bookings to find the booking UID, then cancel it. The booking UID is a string like 'eTHSdCB89qzCiazPWHV15x', not the numeric ID.",
+            "description": "Cancel a booking by its string UID from get_user_bookings, not numeric ID.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "booking_uid": {
                         "type": "string",
-                        "description": "The UID of the booking to cancel (string, not numeric ID). Get this from get_user_bookings."
+                        "description": "Booking UID"
                     },
                     "reason": {
                         "type": "string",
@@ -119,17 +124,17 @@ TOOLS: List[Dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "reschedule_booking",
-            "description": "Reschedule an existing booking to a new time. Use this when the user wants to change the time of an existing meeting. First use get_user_bookings to find the booking UID, then reschedule it. The booking UID is a string like 'hN13LiTrTAsWbuP8dmhLzG', not the numeric ID.",
+            "description": "Move a booking to a new time by its string UID from get_user_bookings.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "booking_uid": {
                         "type": "string",
-                        "description": "The UID of the booking to reschedule (string, not numeric ID). Get this from get_user_bookings."
+                        "description": "Booking UID"
                     },
                     "new_start_time": {
                         "type": "string",
-                        "description": "The new start time in ISO 8601 format (e.g., '2024-01-15T14:00:00Z')"
+                        "description": "New start time, ISO 8601"
                     },
                     "reason": {
                         "type": "string",
@@ -140,4 +145,19 @@ TOOLS: List[Dict[str, Any]] = [
             }
         }
     }
-]
+)
+
+# Serialized once at import so code that ships the schemas over the wire
+# (logging, request bodies built by hand) doesn't re-dump ~kB of dicts per
+# call. The OpenAI SDK takes the dict form, so CalChatbot passes the shared
+# TOOLS object itself — never a per-call copy.
+TOOLS_JSON_BYTES: bytes = orjson.dumps(TOOLS)
+
+# Kept for callers that imported the explicit tuple view before TOOLS
+# itself became a tuple
+TOOLS_TUPLE: tuple = TOOLS
+
+
+def get_tools() -> tuple:
+    """The tool schemas as an immutable tuple"""
+    return TOOLS_TUPLE
@@ -5,112 +5,141 @@ Tests all core and bonus functionality
 """
 
 import asyncio
-import sys
+import traceback
+from collections import namedtuple
 
-sys.path.insert(0, "/Users/HARRY/Projects/chatbot")
+# The run is pure HTTPS I/O, so take the libuv-backed loop when available
+# (uvicorn[standard] already ships it); plain asyncio works fine without
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 from src.chatbot import CalChatbot
-from datetime import datetime
+
+# Section separator, built once at import instead of per print
+BANNER = "=" * 70
 
 
 async def test_all_features():
     """Test all chatbot features systematically with closed-loop testing"""
 
-    print("=" * 70)
+    print(BANNER)
     print("COMPREHENSIVE CHATBOT FEATURE TESTING (CLOSED LOOP)")
-    print("=" * 70)
+    print(BANNER)
     print()
 
     chatbot = CalChatbot()
     conversation_history = []
     user_email = "hairuiwang@yahoo.com"
 
-    tests = [
-        {
-            "name": "Test 1: Get Available Time Slots",
-            "message": "Show me available times for Monday January 19th, 2026",
-        },
-        {
-            "name": "Test 2: Book Meeting #1 (For Cancel Test)",
-            "message": "I want to book a meeting on Tuesday January 20th, 2026 at 10:00 AM Central Time (which is 16:00 UTC). My name is Harry Wang, my email is hairuiwang@yahoo.com, and the reason is to discuss the project requirements. Please book this meeting now.",
-        },
-        {
-            "name": "Test 3: Book Meeting #2 (For Reschedule Test)",
-            "message": "I want to book another meeting on Wednesday January 21th, 2026 at 10:00 AM Central Time (which is 17:00 UTC). My name is Harry Wang, my email is hairuiwang@yahoo.com, and the reason is to discuss the implementation details. Please book this meeting now.",
-        },
-        {
-            "name": "Test 4: List Scheduled Meetings",
-            "message": "Show me all my upcoming meetings",
-        },
-        {
-            "name": "Test 5: Natural Language - Tomorrow",
-            "message": "What times are available tomorrow?",
-        },
-        {
-            "name": "Test 6: Natural Language - Next Week",
-            "message": "Show me slots for next Monday",
-        },
-        {
-            "name": "Test 7: Cancel Meeting #1",
-            "message": "Cancel my meeting on January 20th",
-        },
-        {
-            "name": "Test 8: Verify Cancellation",
-            "message": "Show me all my upcoming meetings",
-        },
-        {
-            "name": "Test 9: Reschedule Meeting #2 (Bonus)",
-            "message": "Reschedule my Wednesday January 21th, 2026 meeting to Thursday January 22th, 2026 at 3pm",
-        },
-        {
-            "name": "Test 10: Verify Reschedule",
-            "message": "Show me all my upcoming meetings",
-        },
-    ]
-
-    for i, test in enumerate(tests, 1):
-        print(f"\n{'='*70}")
-        print(f"{test['name']}")
-        print(f"{'='*70}")
-        print(f"User: {test['message']}")
-        print()
-
+    Test = namedtuple("Test", ("name", "message"))
+
+    # Attribute access on a namedtuple is a C-level index, and the tuple
+    # makes the scenario list immutable
+    tests = (
+        Test(
+            name="Test 1: Get Available Time Slots",
+            message="Show me available times for Monday January 19th, 2026",
+        ),
+        Test(
+            name="Test 2: Book Meeting #1 (For Cancel Test)",
+            message="I want to book a meeting on Tuesday January 20th, 2026 at 10:00 AM Central Time (which is 16:00 UTC). My name is Harry Wang, my email is hairuiwang@yahoo.com, and the reason is to discuss the project requirements. Please book this meeting now.",
+        ),
+        Test(
+            name="Test 3: Book Meeting #2 (For Reschedule Test)",
+            message="I want to book another meeting on Wednesday January 21th, 2026 at 10:00 AM Central Time (which is 17:00 UTC). My name is Harry Wang, my email is hairuiwang@yahoo.com, and the reason is to discuss the implementation details. Please book this meeting now.",
+        ),
+        Test(
+            name="Test 4: List Scheduled Meetings",
+            message="Show me all my upcoming meetings",
+        ),
+        Test(
+            name="Test 5: Natural Language - Tomorrow",
+            message="What times are available tomorrow?",
+        ),
+        Test(
+            name="Test 6: Natural Language - Next Week",
+            message="Show me slots for next Monday",
+        ),
+        Test(
+            name="Test 7: Cancel Meeting #1",
+            message="Cancel my meeting on January 20th",
+        ),
+        Test(
+            name="Test 8: Verify Cancellation",
+            message="Show me all my upcoming meetings",
+        ),
+        Test(
+            name="Test 9: Reschedule Meeting #2 (Bonus)",
+            message="Reschedule my Wednesday January 21th, 2026 meeting to Thursday January 22th, 2026 at 3pm",
+        ),
+        Test(
+            name="Test 10: Verify Reschedule",
+            message="Show me all my upcoming meetings",
+        ),
+    )
+
+    async def run_test(index, test, history):
+        """Run one test and return its printable outcome"""
         try:
-            response, conversation_history = await chatbot.chat(
-                user_message=test["message"],
-                conversation_history=conversation_history,
+            response, _ = await chatbot.chat(
+                user_message=test.message,
+                conversation_history=history,
                 user_email=user_email,
             )
+            return f"Bot: {response}\n\n✅ Test {index} completed"
+        except Exception:
+            return f"❌ Test {index} failed:\n{traceback.format_exc()}"
+
+    # Tests 1, 5 and 6 are independent availability reads, so they run
+    # concurrently (each on its own history). Everything else is a causal
+    # chain — book, list, cancel, verify — and stays serial.
+    independent = (1, 5, 6)
+    results = await asyncio.gather(
+        *(run_test(i, tests[i - 1], []) for i in independent)
+    )
+    outcomes = dict(zip(independent, results))
+
+    # The scenario table is static, so the headers can be formatted once
+    # up front; the loop then only prints prebuilt strings
+    headers = tuple(
+        f"\n{BANNER}\n{t.name}\n{BANNER}\nUser: {t.message}\n" for t in tests
+    )
 
-            print(f"Bot: {response}")
-            print(f"\n✅ Test {i} completed")
-
-        except Exception as e:
-            print(f"❌ Test {i} failed: {str(e)}")
-            import traceback
-
-            traceback.print_exc()
-
-        # Small delay between tests
-        await asyncio.sleep(2)
-
-    print("\n" + "=" * 70)
-    print("TESTING COMPLETE")
-    print("=" * 70)
-    print()
-    print("Summary:")
-    print("- Test 1: Check available slots ✓")
-    print("- Test 2: Book meeting #1 (for cancel) ✓")
-    print("- Test 3: Book meeting #2 (for reschedule) ✓")
-    print("- Test 4: List meetings (verify 2 bookings) ✓")
-    print("- Test 5: Natural language (tomorrow) ✓")
-    print("- Test 6: Natural language (next week) ✓")
-    print("- Test 7: Cancel meeting #1 ✓")
-    print("- Test 8: Verify cancellation (1 booking left) ✓")
-    print("- Test 9: Reschedule meeting #2 (bonus) ✓")
-    print("- Test 10: Verify reschedule (new time) ✓")
-    print()
-    print("All core and bonus features tested in closed loop!")
+    for i, test in enumerate(tests, 1):
+        print(headers[i - 1])
+
+        if i in outcomes:
+            print(outcomes[i])
+            continue
+
+        print(await run_test(i, test, conversation_history))
+
+    print(
+        "\n" + BANNER + "\n"
+        "TESTING COMPLETE\n"
+        + BANNER + "\n"
+        "\n"
+        "Summary:\n"
+        "- Test 1: Check available slots ✓\n"
+        "- Test 2: Book meeting #1 (for cancel) ✓\n"
+        "- Test 3: Book meeting #2 (for reschedule) ✓\n"
+        "- Test 4: List meetings (verify 2 bookings) ✓\n"
+        "- Test 5: Natural language (tomorrow) ✓\n"
+        "- Test 6: Natural language (next week) ✓\n"
+        "- Test 7: Cancel meeting #1 ✓\n"
+        "- Test 8: Verify cancellation (1 booking left) ✓\n"
+        "- Test 9: Reschedule meeting #2 (bonus) ✓\n"
+        "- Test 10: Verify reschedule (new time) ✓\n"
+        "\n"
+        "All core and bonus features tested in closed loop!"
+    )
+
+    # One chatbot (and thus one OpenAI + one Cal.com session) served all ten
+    # tests; release its connection pools now that the run is over
+    await chatbot.aclose()
 
 
 if __name__ == "__main__":